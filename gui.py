@@ -5,69 +5,247 @@
 
 import sys
 import os
+import re
+import time
 import ctypes
+import functools
+import itertools
 import logging
+import logging.handlers
+import queue
+import atexit
 import pythoncom
+import threading
+from collections import deque
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QComboBox, QPushButton, 
-                             QGroupBox, QMessageBox, QProgressBar, QTextEdit, QCheckBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QPixmap, QIcon
+                             QGroupBox, QMessageBox, QProgressBar, QPlainTextEdit, QCheckBox,
+                             QDialog, QScrollArea)
+from PyQt5 import sip
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, pyqtSlot, QTimer, QObject, QRunnable,
+                          QThreadPool, QMetaObject, Q_ARG, QUrl, QSignalBlocker)
+from PyQt5.QtGui import (QFont, QPixmap, QIcon, QTextCursor, QStaticText, QPainter, QTransform,
+                         QDesktopServices)
 
 # 导入网络适配器模块
-from network_adapter import NetworkAdapter
+from network_adapter import NetworkAdapter, DEFAULT_SPEED_DUPLEX_OPTIONS
 from network_settings import NetworkSettings
 from system_compatibility import SystemCompatibility
+from powershell_session import PowerShellSession
 
 # 自定义日志处理器，用于捕获日志到GUI
 class GuiLogHandler(logging.Handler):
+    """只负责缓存日志记录，由GUI主线程通过定时器按序号增量取走，显示时才格式化"""
+    MAX_MESSAGES = 2000  # 最多保留的日志条数
+    MAX_DISPLAY_BLOCKS = 1000  # 日志面板最多显示的行数
+    
     def __init__(self):
         super().__init__()
-        self.log_messages = []
-        self.gui_callback = None
+        self.log_messages = deque(maxlen=self.MAX_MESSAGES)  # 未格式化的 LogRecord
+        self._total = 0  # 累计写入的日志条数，用作增量读取的序号
+        self._buffer_lock = threading.Lock()
     
     def emit(self, record):
-        log_entry = self.format(record)
-        self.log_messages.append(log_entry)
-        # 如果GUI已经初始化，实时更新显示
-        if self.gui_callback:
-            self.gui_callback(log_entry)
+        # 日志面板通常是隐藏的，这里不做格式化，只保存原始记录
+        with self._buffer_lock:
+            self.log_messages.append(record)
+            self._total += 1
     
-    def set_gui_callback(self, callback):
-        self.gui_callback = callback
+    def get_logs_since(self, idx: int, limit: int = None):
+        """返回序号 idx 之后的新日志（已格式化）及最新序号，limit 限制最多返回最新的多少条"""
+        with self._buffer_lock:
+            total = self._total
+            if idx >= total:
+                return [], total
+            first = total - len(self.log_messages)  # 环形缓冲中最早一条的序号
+            if limit is not None:
+                idx = max(idx, total - limit)
+            start = max(idx, first) - first
+            records = list(itertools.islice(self.log_messages, start, None))
+        return [self.format(r) for r in records], total
     
     def get_all_logs(self):
-        return '\n'.join(self.log_messages)
+        with self._buffer_lock:
+            records = list(self.log_messages)
+        return '\n'.join(self.format(r) for r in records)
+
+
+# 资源根目录：打包运行时为解包目录，源码运行时为本文件所在目录
+_ASSET_BASE = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=None)
+def _asset(name: str):
+    """返回 img 目录下资源文件的路径，结果缓存，文件不存在返回None"""
+    path = os.path.join(_ASSET_BASE, "img", name)
+    return path if os.path.exists(path) else None
+
+
+def _relaunch_command():
+    """以管理员身份重启时使用的程序路径和参数"""
+    if getattr(sys, 'frozen', False):
+        # 打包后的exe文件
+        return sys.executable, None
+    # Python脚本：优先使用 pythonw.exe 避免命令行窗口
+    pyexe = sys.executable
+    pywexe = os.path.join(os.path.dirname(pyexe), 'pythonw.exe')
+    return (pywexe if os.path.exists(pywexe) else pyexe), f'"{os.path.abspath(__file__)}"'
+
+
+# 启动时确定一次，点击重启时无需再访问文件系统
+_RELAUNCH_EXE, _RELAUNCH_ARGS = _relaunch_command()
+
+
+@functools.lru_cache(maxsize=None)
+def _logo_fallback_font() -> QFont:
+    """Logo加载失败时备用文字图标的字体"""
+    return QFont("", 48)
+
+
+# 标题、下拉框与按钮样式表
+_LOGO_STYLE = "margin: 15px 0;"
+_LOGO_FALLBACK_STYLE = "color: #2196F3; margin: 15px 0;"
+_TITLE_STYLE = "color: #333333; margin: 5px 0; font-size: 14pt; font-weight: bold;"
+_COMBO_STYLE = "QComboBox { font-size: 12px; padding: 5px; }"
+_REFRESH_BTN_STYLE = "QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }"
+_APPLY_BTN_STYLE = "QPushButton { background-color: #2196F3; color: white; font-weight: bold; }"
+_GITHUB_BTN_STYLE = """
+    QPushButton {
+        background-color: #0366d6;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        text-align: left;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #0256cc;
+    }
+    QPushButton:pressed {
+        background-color: #024ea4;
+    }
+"""
+_ABOUT_TITLE_STYLE = "font-size: 16px; font-weight: bold; margin: 10px 0;"
+_ABOUT_DESC_STYLE = "margin: 10px 0;"
+_LOG_STYLE = """
+    QPlainTextEdit {
+        background-color: #f8f8f8;
+        color: #333333;
+        font-family: 'Consolas', 'Monaco', monospace;
+        font-size: 9pt;
+        border: 1px solid #cccccc;
+    }
+"""
+
+
+# 无线网卡名称关键字（Wireless / Wi-Fi / WiFi / WLAN）
+_WIRELESS_RE = re.compile(r'wireless|wi-?fi|wlan', re.I)
 
 # 创建全局日志处理器实例
 gui_log_handler = GuiLogHandler()
 
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        gui_log_handler
-    ]
-)
+# 日志格式化器只创建一次，控制台和GUI处理器共用
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+gui_log_handler.setFormatter(_log_formatter)
+
+log_listener = None
 
 
-class InitializationThread(QThread):
-    """初始化线程，避免主线程阻塞"""
-    finished = pyqtSignal(bool, str, object)  # 成功标志，错误信息，适配器对象
-    progress_update = pyqtSignal(str)  # 进度更新信号
+def _setup_logging():
+    """配置日志：各线程只负责入队，由单独的监听线程统一格式化并输出到控制台和GUI。
+    在 main() 中调用一次，仅导入本模块时不修改根日志器、不启动监听线程。
+    """
+    global log_listener
+    if log_listener is not None:
+        return
     
-    def __init__(self):
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(_log_formatter)
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # 入队时只合并消息参数，时间和级别等前缀由下游处理器添加
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler]
+    )
+    
+    log_listener = logging.handlers.QueueListener(
+        log_queue, stdout_handler, gui_log_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+
+def qdebounced(func, timeout: int):
+    """防抖包装：timeout 毫秒内的连续调用只在最后一次之后执行一次（需在QApplication创建后调用）"""
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.setInterval(timeout)
+    pending_args = []
+    
+    def fire():
+        func(*pending_args)
+    
+    def wrapper(*args):
+        pending_args[:] = args
+        timer.start()
+    
+    timer.timeout.connect(fire)
+    wrapper.timer = timer
+    return wrapper
+
+
+class NetworkWorker(QObject):
+    """后台工作对象，移动到常驻线程中运行，初始化/刷新/应用设置都在该线程内按顺序执行，避免界面卡死。
+    
+    槽函数通过排队连接（QMetaObject.invokeMethod / 跨线程信号）调用，整个线程只初始化一次COM。
+    """
+    init_finished = pyqtSignal(bool, str, object)  # 成功标志，错误信息，适配器对象
+    refresh_finished = pyqtSignal(bool, str)  # 适配器列表通过 take_result_adapters() 取走
+    operation_finished = pyqtSignal(bool, str, object)  # object 类型不做逐项转换
+    apply_succeeded = pyqtSignal(str, str)  # 适配器名称，结果信息
+    adapter_refreshed = pyqtSignal(str, object)  # 连接名称(alias)，更新后的 AdapterInfo（查询失败为None）
+    progress_update = pyqtSignal(str)
+    
+    def __init__(self, settings):
         super().__init__()
+        self.settings = settings
+        self.adapter = None
+        self.result_adapters = []  # 最近一次刷新的结果，由界面线程在 refresh_finished 后取走
     
-    def run(self):
-        # 每个线程必须初始化COM
+    def take_result_adapters(self) -> list:
+        """取走最近一次刷新结果并释放引用"""
+        adapters, self.result_adapters = self.result_adapters, []
+        return adapters
+    
+    @staticmethod
+    def _interrupted() -> bool:
+        """程序关闭时界面会请求中断工作线程，各步骤之间检查以尽早退出"""
+        return QThread.currentThread().isInterruptionRequested()
+    
+    @pyqtSlot()
+    def setup_com(self):
+        """在工作线程启动时初始化COM（MTA）"""
+        try:
+            pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        except:
+            pass
+    
+    @pyqtSlot()
+    def teardown_com(self):
+        """在工作线程退出时反初始化COM"""
+        try:
+            pythoncom.CoUninitialize()
+        except:
+            pass
+    
+    @pyqtSlot()
+    def initialize(self):
         try:
-            try:
-                pythoncom.CoInitialize()
-            except:
-                pass
             self.progress_update.emit("正在初始化网络适配器模块...")
             
             # 创建适配器对象（延迟初始化）
@@ -77,112 +255,272 @@ class InitializationThread(QThread):
             # 进行健康检查
             health = adapter.health_check()
             if not health['wmi_available']:
-                self.finished.emit(False, "WMI服务不可用，请检查系统配置", None)
+                self.init_finished.emit(False, "WMI服务不可用，请检查系统配置", None)
                 return
             if not health['powershell_available']:
-                self.finished.emit(False, "PowerShell不可用，请检查系统配置", None)
+                self.init_finished.emit(False, "PowerShell不可用，请检查系统配置", None)
                 return
             
+            self.adapter = adapter
             self.progress_update.emit("初始化完成")
-            self.finished.emit(True, "", adapter)
+            self.init_finished.emit(True, "", adapter)
             
         except Exception as e:
             error_msg = f"初始化失败: {str(e)}"
             logging.error(error_msg)
-            self.finished.emit(False, error_msg, None)
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
-
-
-class WorkerThread(QThread):
-    """后台工作线程，避免界面卡死"""
-    finished = pyqtSignal(bool, str, list)
-    progress_update = pyqtSignal(str)
-    
-    def __init__(self, settings, adapter, adapter_name, speed_duplex):
-        super().__init__()
-        self.settings = settings
-        self.adapter = adapter
-        self.adapter_name = adapter_name
-        self.speed_duplex = speed_duplex
+            self.init_finished.emit(False, error_msg, None)
+            return
+        
+        # 初始化成功后直接在本线程获取首批适配器，省去界面再发起一次刷新的等待
+        if not self._interrupted():
+            self.refresh()
     
-    def run(self):
-        # 每个线程必须初始化COM
+    @pyqtSlot(str, str)
+    def apply(self, adapter_name, speed_duplex):
         try:
-            try:
-                pythoncom.CoInitialize()
-            except:
-                pass
-            
-            logging.info(f"开始应用网络设置: {self.adapter_name} -> {self.speed_duplex}")
+            logging.info("开始应用网络设置: %s -> %s", adapter_name, speed_duplex)
             self.progress_update.emit("正在应用网络设置...")
             
-            success, message = self.settings.set_adapter_speed_duplex(
-                self.adapter_name, self.speed_duplex)
+            success, message = self.settings.set_adapter_speed_duplex(adapter_name, speed_duplex)
             
             if success:
                 logging.info("网络设置应用成功，等待网络适配器重新初始化")
                 self.progress_update.emit("等待网络适配器重新初始化...")
-                import time
-                time.sleep(2)  # 减少等待时间
-                
-                logging.info("网络设置应用成功，获取更新状态")
-                try:
-                    updated_status = self.settings.get_current_speed_duplex(self.adapter_name)
-                    self.finished.emit(True, message, [{'adapter_name': self.adapter_name, 'new_status': updated_status}])
-                except Exception as status_error:
-                    logging.warning(f"获取更新状态失败: {str(status_error)}")
-                    self.finished.emit(True, message, [])
+                # 等待由GUI定时器完成，期间本线程可继续处理其他任务
+                self.apply_succeeded.emit(adapter_name, message)
             else:
-                logging.error(f"网络设置应用失败: {message}")
-                self.finished.emit(False, message, [])
+                logging.error("网络设置应用失败: %s", message)
+                self.operation_finished.emit(False, message, [])
                 
         except Exception as e:
-            logging.error(f"操作异常: {str(e)}")
-            self.finished.emit(False, f"操作失败: {str(e)}", [])
+            logging.error("操作异常: %s", e)
+            self.operation_finished.emit(False, f"操作失败: {str(e)}", [])
+    
+    @pyqtSlot(str, str)
+    def fetch_status(self, adapter_name, message):
+        if self._interrupted():
+            return
+        logging.info("网络设置应用成功，获取更新状态")
+        try:
+            updated_status = self.settings.get_current_speed_duplex(adapter_name)
+            self.operation_finished.emit(True, message, [{'adapter_name': adapter_name, 'new_status': updated_status}])
+        except Exception as status_error:
+            logging.warning("获取更新状态失败: %s", status_error)
+            self.operation_finished.emit(True, message, [])
+    
+    @pyqtSlot()
+    def refresh(self):
+        if self._interrupted():
+            return
+        try:
+            logging.info("开始刷新适配器列表")
+            self.progress_update.emit("正在刷新适配器列表...")
+            # 一次PowerShell调用同时取回各适配器的当前速度双工设置
+            adapters = self.adapter.get_all_adapters_with_status()
+            # 在后台线程中预先标记无线网卡，切换过滤开关时无需再做字符串匹配
+            for a in adapters:
+                a.is_wireless = bool(_WIRELESS_RE.search(a.name or ''))
+            logging.info("刷新完成，找到 %d 个适配器", len(adapters))
+            self.result_adapters = adapters
+            self.refresh_finished.emit(True, "")
+        except Exception as e:
+            error_msg = f"刷新适配器失败: {str(e)}"
+            logging.error(error_msg)
+            self.result_adapters = []
+            self.refresh_finished.emit(False, error_msg)
+    
+    @pyqtSlot(str)
+    def refresh_one(self, alias):
+        """只重新查询一个适配器（应用设置后确认是否生效时使用）"""
+        if self._interrupted():
+            return
+        try:
+            info = self.adapter.get_single_adapter(alias)
+            if info is not None:
+                info.is_wireless = bool(_WIRELESS_RE.search(info.name or ''))
+        except Exception as e:
+            logging.warning("刷新适配器 %s 失败: %s", alias, e)
+            info = None
+        self.adapter_refreshed.emit(alias, info)
+
+
+class AdapterEventWorker(QThread):
+    """订阅WMI适配器修改事件，适配器速度/连接状态变化时通知界面，替代定时轮询刷新"""
+    adapter_changed = pyqtSignal(str, str)  # 连接名称(alias)，连接状态
+    watch_failed = pyqtSignal(str)
+    
+    WQL = ("SELECT * FROM __InstanceModificationEvent WITHIN 1 "
+           "WHERE TargetInstance ISA 'Win32_NetworkAdapter'")
+    POLL_TIMEOUT_MS = 250  # 单次等待事件的时长，决定响应退出请求的延迟
+    
+    def run(self):
+        try:
+            pythoncom.CoInitialize()
+        except:
+            pass
+        try:
+            import wmi
+            watcher = wmi.WMI(find_classes=False).watch_for(raw_wql=self.WQL)
+        except Exception as e:
+            logging.warning("WMI适配器事件订阅失败，使用定时刷新: %s", e)
+            self.watch_failed.emit(str(e))
+            self._uninit_com()
+            return
+        
+        try:
+            while not self.isInterruptionRequested():
+                try:
+                    # 带超时等待，便于及时响应退出请求
+                    event = watcher(timeout_ms=self.POLL_TIMEOUT_MS)
+                except wmi.x_wmi_timed_out:
+                    continue
+                alias = getattr(event, 'NetConnectionID', None) or getattr(event, 'Name', None) or ''
+                status = getattr(event, 'NetConnectionStatus', None)
+                self.adapter_changed.emit(str(alias), '' if status is None else str(status))
+        except Exception as e:
+            logging.warning("WMI适配器事件监听异常: %s", e)
+            self.watch_failed.emit(str(e))
         finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+            self._uninit_com()
+    
+    @staticmethod
+    def _uninit_com():
+        try:
+            pythoncom.CoUninitialize()
+        except:
+            pass
 
 
-class RefreshThread(QThread):
-    """刷新适配器的后台线程"""
-    finished = pyqtSignal(bool, str, list)
-    progress_update = pyqtSignal(str)
+class CompatReportSignals(QObject):
+    ready = pyqtSignal(object)  # 兼容性报告字典，失败时为None
+
+
+class CompatReportRunnable(QRunnable):
+    """在线程池中生成系统兼容性报告（涉及WMI/PowerShell，耗时较长）"""
     
-    def __init__(self, adapter):
+    def __init__(self):
         super().__init__()
-        self.adapter = adapter
+        self.signals = CompatReportSignals()
     
     def run(self):
-        # 每个线程必须初始化COM
         try:
-            try:
-                pythoncom.CoInitialize()
-            except:
-                pass
-            logging.info("开始刷新适配器列表")
-            self.progress_update.emit("正在刷新适配器列表...")
-            adapters = self.adapter.get_all_adapters()
-            logging.info(f"刷新完成，找到 {len(adapters)} 个适配器")
-            self.finished.emit(True, "", adapters)
+            pythoncom.CoInitialize()
+        except:
+            pass
+        try:
+            report = SystemCompatibility().get_compatibility_report()
         except Exception as e:
-            error_msg = f"刷新适配器失败: {str(e)}"
-            logging.error(error_msg)
-            self.finished.emit(False, error_msg, [])
+            logging.warning("生成兼容性报告失败: %s", e)
+            report = None
         finally:
             try:
                 pythoncom.CoUninitialize()
             except:
                 pass
+        self.signals.ready.emit(report)
+
+
+class AdapterStatusSignals(QObject):
+    done = pyqtSignal(str, object, object)  # alias，当前速度双工（未查询为None），支持的选项（未查询为None）
+
+
+class AdapterStatusRunnable(QRunnable):
+    """在线程池中查询所选适配器的当前速度双工和支持的选项，避免切换适配器时阻塞界面"""
+    
+    def __init__(self, settings, adapter, alias, need_value, need_options):
+        super().__init__()
+        self.signals = AdapterStatusSignals()
+        self.settings = settings
+        self.adapter = adapter
+        self.alias = alias
+        self.need_value = need_value
+        self.need_options = need_options
+    
+    def run(self):
+        value = None
+        options = [] if self.need_options else None
+        try:
+            if self.need_value:
+                value = self.settings.get_current_speed_duplex(self.alias)
+            if self.need_options:
+                options = self.adapter.get_speed_duplex_options(self.alias, use_fallback=False)
+        except Exception as e:
+            logging.warning("查询适配器状态失败: %s", e)
+        self.signals.done.emit(self.alias, value, options)
+
+
+class FeaturesView(QWidget):
+    """用QStaticText绘制关于对话框中的大段静态说明文字，布局只计算一次"""
+    
+    def __init__(self, text: str, width: int, parent=None):
+        super().__init__(parent)
+        html = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('\n', '<br>')
+        self._static = QStaticText(html)
+        self._static.setTextFormat(Qt.RichText)
+        self._static.setTextWidth(width)
+        self._static.setPerformanceHint(QStaticText.AggressiveCaching)
+        self._static.prepare(QTransform(), self.font())
+        size = self._static.size()
+        self.setFixedHeight(int(size.height()) + 20)  # 上下各留10px边距
+        self.setMinimumWidth(int(size.width()))
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawStaticText(0, 10, self._static)
+
+
+class DiagnosisDialog(QDialog):
+    """系统诊断报告对话框，纯文本显示，可复制报告或请求重新检测"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("系统诊断")
+        self.resize(800, 500)
+        self.rerun_requested = False
+        
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("系统兼容性诊断完成"))
+        
+        self.text_view = QPlainTextEdit()
+        self.text_view.setReadOnly(True)
+        self.text_view.setMinimumSize(750, 400)
+        layout.addWidget(self.text_view)
+        
+        button_layout = QHBoxLayout()
+        copy_btn = QPushButton("复制")
+        copy_btn.clicked.connect(lambda: QApplication.clipboard().setText(self.text_view.toPlainText()))
+        button_layout.addWidget(copy_btn)
+        rerun_btn = QPushButton("重新检测")
+        rerun_btn.clicked.connect(self._on_rerun)
+        button_layout.addWidget(rerun_btn)
+        button_layout.addStretch()
+        close_btn = QPushButton("关闭")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+    
+    def _on_rerun(self):
+        self.rerun_requested = True
+        self.accept()
+    
+    def show_report(self, text: str) -> bool:
+        """显示报告（模态），返回用户是否点击了重新检测"""
+        self.rerun_requested = False
+        self.text_view.setPlainText(text)
+        self.exec_()
+        return self.rerun_requested
 
 
 class NetworkAdapterGUI(QMainWindow):
+    SPEED_DUPLEX_CACHE_TTL = 5.0  # 当前速度双工缓存有效期（秒）
+    SPEED_DUPLEX_CACHE_SIZE = 16
+    APPLY_SETTLE_DELAY_MS = 2000  # 应用设置后等待适配器重新初始化的时间
+    ADAPTER_EVENT_TIMEOUT_MS = 3000  # 等待WMI适配器变化事件的最长时间，超时后直接刷新
+    DYNAMIC_REFRESH_BACKOFF_MS = (300, 600, 1200, 2400)  # 应用设置后确认生效的刷新间隔（指数退避）
+    BUSY_INDICATOR_DELAY_MS = 250  # 操作持续超过该时长才显示忙碌进度条
+    SHUTDOWN_WAIT_MS = 500  # 关闭时等待所有后台线程退出的总时长
+    _logo_pixmap = None  # 缩放后的Logo，见 _get_logo_pixmap
+    
     def __init__(self):
         try:
             print("Initializing NetworkAdapterGUI...")
@@ -193,18 +531,38 @@ class NetworkAdapterGUI(QMainWindow):
             self.adapter = None
             self.settings = NetworkSettings()
             self.current_adapters = []
-            self.worker_thread = None
-            self.refresh_thread = None
-            self.init_thread = None
+            self._worker = None
+            self._worker_thread = None
+            self._refresh_running = False
+            self._refresh_pending = False  # 刷新进行中又收到的刷新请求，完成后合并为一次
+            self._status_runnables = set()  # 进行中的适配器状态查询
             self.log_visible = False
+            self._log_flushed_idx = 0  # 已显示到日志控件中的日志序号
             self.initialization_complete = False
             # 动态刷新状态
             self._dynamic_refresh_active = False
             self._dynamic_target_alias = None
             self._dynamic_target_value = None
             self._dynamic_attempt_idx = 0
+            self._dynamic_check_pending = False  # 等待后台查询结果以判断设置是否生效
+            # WMI适配器事件订阅（仅在应用设置后等待确认期间存在，可用时替代首次定时刷新）
+            self._adapter_watcher = None
+            self._adapter_watcher_ok = True  # 订阅失败过一次后不再尝试
+            self._awaiting_adapter_event = False
             # 延后提示相关
             self._pending_success_message = None
+            # 速度双工查询缓存：当前值短时缓存，支持的选项在会话内缓存
+            self._speed_duplex_cache = {}
+            self._speed_duplex_options_cache = {}
+            self._compat_runnable = None
+            self._compat_report = None  # 缓存的兼容性报告，首次打开系统诊断时生成，仅在用户重新检测时更新
+            self._compat_callbacks = []  # 等待报告生成完成的回调
+            self._last_list_fingerprint = None  # 上次下拉框中显示的适配器列表
+            self._name_to_index = {}  # 下拉框中适配器名称 -> 索引
+            self._name_to_adapter = {}  # 适配器名称 -> AdapterInfo，切换选择时直接查找
+            self._selected_adapter = None  # 下拉框当前选中的适配器，选择或列表变化时同步
+            self._about_dialog = None  # 首次打开时创建，之后复用
+            self._diag_dialog = None
             print("Variables initialized successfully")
             
             # 先初始化UI
@@ -212,16 +570,18 @@ class NetworkAdapterGUI(QMainWindow):
             self.init_ui()
             print("UI initialized successfully")
             
-            # 设置日志回调
+            # 定时批量刷新日志，避免每条日志都触发一次重绘
             print("Setting up logging...")
-            gui_log_handler.set_gui_callback(self.append_log_message)
+            self._log_flush_timer = QTimer(self)
+            self._log_flush_timer.timeout.connect(self._flush_log_buffer)
+            self._log_flush_timer.start(80)
             
-            logging.info(f"程序启动 - 管理员模式: {self.settings.is_admin}")
+            logging.info("程序启动 - 管理员模式: %s", self.settings.is_admin)
             logging.info("网络适配器管理工具已启动")
             
             # 显示启动状态
             print("Setting up initial state...")
-            self.statusBar().showMessage("正在初始化...")
+            self._show_status("正在初始化...")
             self.refresh_btn.setEnabled(False)
             self.apply_btn.setEnabled(False)
             
@@ -230,6 +590,21 @@ class NetworkAdapterGUI(QMainWindow):
                 QTimer.singleShot(50, lambda: self.restart_as_admin(silent=True))
                 return
             
+            # 启动常驻后台工作线程（初始化/刷新/应用设置共用，COM只初始化一次）
+            print("Starting worker thread...")
+            self._worker_thread = QThread(self)
+            self._worker = NetworkWorker(self.settings)
+            self._worker.moveToThread(self._worker_thread)
+            self._worker_thread.started.connect(self._worker.setup_com)
+            self._worker_thread.finished.connect(self._worker.teardown_com, Qt.DirectConnection)
+            self._worker.init_finished.connect(self.on_initialization_finished)
+            self._worker.refresh_finished.connect(self.on_refresh_finished)
+            self._worker.operation_finished.connect(self.on_operation_finished)
+            self._worker.apply_succeeded.connect(self.on_apply_succeeded)
+            self._worker.adapter_refreshed.connect(self.on_adapter_refreshed)
+            self._worker.progress_update.connect(self.on_progress_update)
+            self._worker_thread.start()
+            
             # 启动后台初始化
             print("Starting background initialization...")
             self.start_initialization()
@@ -241,103 +616,98 @@ class NetworkAdapterGUI(QMainWindow):
             traceback.print_exc()
             raise
     
-    def closeEvent(self, event):
-        """程序关闭时清理资源"""
-        try:
-            # 停止所有后台线程
-            threads_to_stop = [
-                ('worker_thread', self.worker_thread),
-                ('refresh_thread', self.refresh_thread), 
-                ('init_thread', self.init_thread)
-            ]
-            
-            for thread_name, thread_obj in threads_to_stop:
-                if thread_obj and thread_obj.isRunning():
-                    print(f"Stopping {thread_name}...")
-                    thread_obj.quit()
-                    if not thread_obj.wait(3000):  # 等待3秒
-                        print(f"Warning: {thread_name} did not stop gracefully")
-                        thread_obj.terminate()
-            
-            # 清理WMI连接
-            if self.adapter:
-                try:
-                    if hasattr(self.adapter, 'wmi_conn') and self.adapter.wmi_conn:
-                        self.adapter.wmi_conn = None
-                except:
-                    pass
-            
-            print("Resource cleanup completed")
-            event.accept()
-            
-        except Exception as e:
-            print(f"Error during cleanup: {e}")
-            event.accept()
-    
     def start_initialization(self):
         """启动后台初始化"""
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # 无限进度条
+        self._set_busy(True)
         
-        self.init_thread = InitializationThread()
-        self.init_thread.finished.connect(self.on_initialization_finished)
-        self.init_thread.progress_update.connect(self.on_progress_update)
-        self.init_thread.start()
+        QMetaObject.invokeMethod(self._worker, "initialize", Qt.QueuedConnection)
     
     def on_initialization_finished(self, success, error_msg, adapter):
         """初始化完成处理"""
-        self.progress_bar.setVisible(False)
-        
         if success:
             self.adapter = adapter
             self.initialization_complete = True
-            self.refresh_btn.setEnabled(True)
             self.apply_btn.setEnabled(True)
-            self.statusBar().showMessage("初始化完成 - 就绪")
+            self._show_status("初始化完成 - 就绪")
             
-            # 自动刷新适配器列表
-            QTimer.singleShot(500, self.refresh_adapters)
+            # 工作线程紧接着获取首批适配器，完成后由 on_refresh_finished 处理
+            self._refresh_running = True
+            # 兼容性报告在首次打开系统诊断时才生成（之后使用缓存），不在启动时与首次刷新争用PowerShell会话
             
         else:
-            logging.error(f"初始化失败: {error_msg}")
-            self.statusBar().showMessage("初始化失败")
+            self._set_busy(False)
+            logging.error("初始化失败: %s", error_msg)
+            self._show_status("初始化失败")
             
             # 如果是WMI/权限相关问题且不是管理员，直接静默提权重启
             if ("WMI" in error_msg or "权限" in error_msg) and not self.settings.is_admin:
                 self.restart_as_admin(silent=True)
                 return
             
-            # 其他错误：提供详细诊断信息
-            try:
-                compatibility = SystemCompatibility()
-                report = compatibility.get_compatibility_report()
-                
-                # 构建详细错误信息
-                detailed_msg = f"初始化失败: {error_msg}\n\n"
-                detailed_msg += "系统诊断信息:\n"
-                detailed_msg += f"• PowerShell: {'可用' if report['powershell']['available'] else '不可用'}\n"
-                detailed_msg += f"• WMI: {'可用' if report['wmi']['available'] else '不可用'}\n"
-                detailed_msg += f"• 管理员权限: {'是' if report['system_info'].get('is_admin', False) else '否'}\n"
-                
-                if report['recommendations']:
-                    detailed_msg += "\n建议:\n"
-                    for i, rec in enumerate(report['recommendations'][:3], 1):  # 只显示前3个建议
-                        detailed_msg += f"{i}. {rec}\n"
-                
-                detailed_msg += "\n是否要重试？"
-                
-                reply = QMessageBox.critical(self, "初始化失败", detailed_msg,
-                                           QMessageBox.Retry | QMessageBox.Close)
-            except Exception:
-                # 如果兼容性检查也失败，使用简单错误信息
-                reply = QMessageBox.critical(self, "初始化失败", 
-                                           f"{error_msg}\n\n是否要重试？",
-                                           QMessageBox.Retry | QMessageBox.Close)
+            # 其他错误：在后台生成诊断报告，完成后再提示，避免再次卡住界面
+            self._show_status("初始化失败，正在进行系统诊断...")
+            self._set_busy(True)
+            self._request_compat_report(
+                functools.partial(self._show_initialization_failure, error_msg))
+    
+    def _request_compat_report(self, callback=None, force: bool = False):
+        """获取兼容性报告：有缓存时直接回调，否则在线程池中生成，完成后回调 callback(report)"""
+        if self._compat_report is not None and not force:
+            if callback:
+                callback(self._compat_report)
+            return
+        if callback:
+            self._compat_callbacks.append(callback)
+        if self._compat_runnable is not None:
+            return  # 已在生成中，完成后统一回调
+        self._compat_runnable = CompatReportRunnable()
+        self._compat_runnable.signals.ready.connect(self._on_compat_report_ready)
+        QThreadPool.globalInstance().start(self._compat_runnable)
+    
+    def _on_compat_report_ready(self, report):
+        """兼容性报告生成完成（report 为 None 表示生成失败，不缓存）"""
+        self._compat_runnable = None
+        if report is not None:
+            self._compat_report = report
+        callbacks, self._compat_callbacks = self._compat_callbacks, []
+        for callback in callbacks:
+            callback(report)
+    
+    def _show_initialization_failure(self, error_msg, report):
+        """诊断报告就绪后显示初始化失败对话框，report 为 None 表示诊断失败"""
+        self._set_busy(False)
+        self._show_status("初始化失败")
+        
+        try:
+            if report is None:
+                raise Exception("兼容性检查失败")
             
-            if reply == QMessageBox.Retry:
-                QTimer.singleShot(1000, self.start_initialization)
-            else:
-                self.close()
+            # 构建详细错误信息
+            detailed_msg = f"初始化失败: {error_msg}\n\n"
+            detailed_msg += "系统诊断信息:\n"
+            detailed_msg += f"• PowerShell: {'可用' if report['powershell']['available'] else '不可用'}\n"
+            detailed_msg += f"• WMI: {'可用' if report['wmi']['available'] else '不可用'}\n"
+            detailed_msg += f"• 管理员权限: {'是' if report['system_info'].get('is_admin', False) else '否'}\n"
+            
+            if report['recommendations']:
+                detailed_msg += "\n建议:\n"
+                for i, rec in enumerate(report['recommendations'][:3], 1):  # 只显示前3个建议
+                    detailed_msg += f"{i}. {rec}\n"
+            
+            detailed_msg += "\n是否要重试？"
+            
+            reply = QMessageBox.critical(self, "初始化失败", detailed_msg,
+                                       QMessageBox.Retry | QMessageBox.Close)
+        except Exception:
+            # 如果兼容性检查也失败，使用简单错误信息
+            reply = QMessageBox.critical(self, "初始化失败", 
+                                       f"{error_msg}\n\n是否要重试？",
+                                       QMessageBox.Retry | QMessageBox.Close)
+        
+        if reply == QMessageBox.Retry:
+            QTimer.singleShot(1000, self.start_initialization)
+        else:
+            self.close()
     
     def show_admin_warning(self):
         """显示管理员权限警告，提供自动重启选项"""
@@ -359,50 +729,55 @@ class NetworkAdapterGUI(QMainWindow):
                 self.restart_as_admin()
             else:
                 # 用户选择继续，但功能受限
-                self.statusBar().showMessage("功能受限模式 - 建议以管理员身份运行")
+                self._show_status("功能受限模式 - 建议以管理员身份运行")
     
     def restart_as_admin(self, silent: bool = False):
         """以管理员身份重启程序。
         silent=True 时不弹窗，尽量使用 pythonw.exe 以避免命令行窗口。
         """
+        # 先隐藏窗口，在下一次事件循环中再启动新进程并退出，避免嵌套处理事件
+        self.hide()
+        QTimer.singleShot(0, functools.partial(self._do_relaunch, silent))
+    
+    def _do_relaunch(self, silent):
+        """以管理员身份启动新进程，成功后关闭窗口并退出事件循环"""
         try:
-            import ctypes
-            import sys
-            
-            # 获取当前程序路径
-            if getattr(sys, 'frozen', False):
-                # 如果是打包后的exe文件
-                current_exe = sys.executable
-                args = None
-            else:
-                # 如果是Python脚本
-                # 优先使用 pythonw.exe 避免命令行窗口
-                pyexe = sys.executable
-                pywexe = os.path.join(os.path.dirname(pyexe), 'pythonw.exe')
-                current_exe = pywexe if os.path.exists(pywexe) else pyexe
-                script_path = os.path.abspath(__file__)
-                args = f'"{script_path}"'
-            
-            # 关闭当前程序
-            self.close()
-            QApplication.processEvents()
-            
             # 使用ShellExecuteW以管理员身份启动
             # 显示状态：0隐藏窗口，1正常显示
             show_cmd = 0 if (not getattr(sys, 'frozen', False)) else 1
-            ctypes.windll.shell32.ShellExecuteW(
-                None, "runas", current_exe, args, None, show_cmd
+            result = ctypes.windll.shell32.ShellExecuteW(
+                None, "runas", _RELAUNCH_EXE, _RELAUNCH_ARGS, None, show_cmd
             )
-            
-            # 退出当前程序
-            QApplication.quit()
-            sys.exit(0)
-            
+            if result <= 32:
+                raise OSError(f"ShellExecuteW 返回 {result}")
         except Exception as e:
-            if not silent:
-                # 如果启动失败，显示错误
-                QMessageBox.critical(self, "错误", f"无法以管理员身份启动程序: {str(e)}")
-                self.show()
+            self._on_relaunch_failed(str(e), silent)
+            return
+        
+        # 关闭当前程序（closeEvent 负责清理后台线程）
+        self.close()
+        QApplication.quit()
+    
+    def _on_relaunch_failed(self, error, silent):
+        if not silent:
+            # 如果启动失败，显示错误
+            QMessageBox.critical(self, "错误", f"无法以管理员身份启动程序: {error}")
+        if not self.settings.is_admin:
+            self._show_status("功能受限模式 - 建议以管理员身份运行")
+        self.show()
+    
+    @classmethod
+    def _get_logo_pixmap(cls):
+        """加载并缩放Logo，结果在类级别缓存，找不到或加载失败返回None"""
+        if cls._logo_pixmap is None:
+            logo_path = _asset("NA (蓝透明).jpg")
+            if not logo_path:
+                return None
+            pixmap = QPixmap(logo_path)
+            if pixmap.isNull():
+                return None
+            cls._logo_pixmap = pixmap.scaled(120, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return cls._logo_pixmap
     
     def init_ui(self):
         """初始化用户界面"""
@@ -419,7 +794,7 @@ class NetworkAdapterGUI(QMainWindow):
         
         # 系统诊断动作
         system_diag_action = help_menu.addAction('系统诊断')
-        system_diag_action.triggered.connect(self.show_system_diagnosis)
+        system_diag_action.triggered.connect(lambda: self.show_system_diagnosis())
         
         # 关于动作
         about_action = help_menu.addAction('关于')
@@ -427,21 +802,11 @@ class NetworkAdapterGUI(QMainWindow):
         
         # 设置窗口图标
         try:
-            # 支持多种部署方式的资源路径查找
-            possible_paths = [
-                os.path.join(os.path.dirname(__file__), "img", "NA.ico"),  # 源码运行
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "img", "NA.ico"),  # 绝对路径
-                os.path.join(os.getcwd(), "img", "NA.ico"),  # 当前工作目录
-                "img/NA.ico",  # 相对路径
-                "NA.ico"  # 同目录
-            ]
-            
-            for icon_path in possible_paths:
-                if os.path.exists(icon_path):
-                    self.setWindowIcon(QIcon(icon_path))
-                    break
+            icon_path = _asset("NA.ico")
+            if icon_path:
+                self.setWindowIcon(QIcon(icon_path))
         except Exception as e:
-            logging.warning(f"加载窗口图标失败: {str(e)}")
+            logging.warning("加载窗口图标失败: %s", e)
         
         # 创建中央widget
         central_widget = QWidget()
@@ -459,44 +824,23 @@ class NetworkAdapterGUI(QMainWindow):
         logo_label = QLabel()
         logo_label.setAlignment(Qt.AlignCenter)
         try:
-            # 支持多种部署方式的Logo路径查找
-            possible_logo_paths = [
-                os.path.join(os.path.dirname(__file__), "img", "NA (蓝透明).jpg"),  # 源码运行
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "img", "NA (蓝透明).jpg"),  # 绝对路径
-                os.path.join(os.getcwd(), "img", "NA (蓝透明).jpg"),  # 当前工作目录
-                "img/NA (蓝透明).jpg",  # 相对路径
-                "NA (蓝透明).jpg"  # 同目录
-            ]
-            
-            logo_loaded = False
-            for logo_path in possible_logo_paths:
-                if os.path.exists(logo_path):
-                    pixmap = QPixmap(logo_path)
-                    if not pixmap.isNull():
-                        scaled_pixmap = pixmap.scaled(120, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        logo_label.setPixmap(scaled_pixmap)
-                        logo_label.setStyleSheet("margin: 15px 0;")
-                        logo_loaded = True
-                        break
-            
-            if not logo_loaded:
+            scaled_pixmap = self._get_logo_pixmap()
+            if scaled_pixmap is None:
                 raise Exception("未找到Logo文件")
+            logo_label.setPixmap(scaled_pixmap)
+            logo_label.setStyleSheet(_LOGO_STYLE)
         except Exception:
             # 使用文本作为备用Logo
             logo_label.setText("🔧")
-            logo_label.setFont(QFont("", 48))
-            logo_label.setStyleSheet("color: #2196F3; margin: 15px 0;")
+            logo_label.setFont(_logo_fallback_font())
+            logo_label.setStyleSheet(_LOGO_FALLBACK_STYLE)
         
         header_layout.addWidget(logo_label)
         
         # 标题
         title_label = QLabel("网络适配器管理工具")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: #333333; margin: 5px 0;")
+        title_label.setStyleSheet(_TITLE_STYLE)
         header_layout.addWidget(title_label)
         
         main_layout.addLayout(header_layout)
@@ -506,9 +850,12 @@ class NetworkAdapterGUI(QMainWindow):
         adapter_layout = QVBoxLayout(adapter_group)
         
         self.adapter_combo = QComboBox()
-        self.adapter_combo.currentTextChanged.connect(self.on_adapter_changed)
+        # 防抖：快速切换或批量填充时只对最终选择执行耗时查询
+        self._debounced_adapter_changed = qdebounced(self.on_adapter_changed, 150)
+        # on_adapter_changed 触发时会重新读取下拉框，不需要信号携带的文本
+        self.adapter_combo.currentIndexChanged.connect(self._on_adapter_index_changed)
         self.adapter_combo.setMinimumHeight(35)
-        self.adapter_combo.setStyleSheet("QComboBox { font-size: 12px; padding: 5px; }")
+        self.adapter_combo.setStyleSheet(_COMBO_STYLE)
         self.adapter_combo.addItem("正在初始化...")
         self.adapter_combo.setEnabled(False)
         adapter_layout.addWidget(self.adapter_combo)
@@ -537,7 +884,7 @@ class NetworkAdapterGUI(QMainWindow):
         speed_duplex_layout.addWidget(QLabel("速度和双工:"))
         self.speed_duplex_combo = QComboBox()
         self.speed_duplex_combo.setMinimumHeight(35)
-        self.speed_duplex_combo.setStyleSheet("QComboBox { font-size: 12px; padding: 5px; }")
+        self.speed_duplex_combo.setStyleSheet(_COMBO_STYLE)
         self.speed_duplex_combo.addItem("请等待初始化完成")
         self.speed_duplex_combo.setEnabled(False)
         speed_duplex_layout.addWidget(self.speed_duplex_combo)
@@ -550,15 +897,15 @@ class NetworkAdapterGUI(QMainWindow):
         button_layout.setSpacing(10)
         
         self.refresh_btn = QPushButton("刷新")
-        self.refresh_btn.clicked.connect(self.refresh_adapters)
-        self.refresh_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; }")
+        self.refresh_btn.clicked.connect(self._on_refresh_clicked)
+        self.refresh_btn.setStyleSheet(_REFRESH_BTN_STYLE)
         self.refresh_btn.setMinimumWidth(160)
         self.refresh_btn.setEnabled(False)
         button_layout.addWidget(self.refresh_btn)
         
         self.apply_btn = QPushButton("应用设置")
         self.apply_btn.clicked.connect(self.apply_settings)
-        self.apply_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; font-weight: bold; }")
+        self.apply_btn.setStyleSheet(_APPLY_BTN_STYLE)
         self.apply_btn.setMinimumWidth(160)
         self.apply_btn.setEnabled(False)
         button_layout.addWidget(self.apply_btn)
@@ -579,28 +926,46 @@ class NetworkAdapterGUI(QMainWindow):
         main_layout.addLayout(button_layout)
         
         # 日志显示区域
-        self.log_widget = QTextEdit()
+        self.log_widget = QPlainTextEdit()
         self.log_widget.setVisible(False)
         self.log_widget.setMaximumHeight(200)
         self.log_widget.setReadOnly(True)
-        self.log_widget.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f8f8;
-                color: #333333;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 9pt;
-                border: 1px solid #cccccc;
-            }
-        """)
+        self.log_widget.setMaximumBlockCount(GuiLogHandler.MAX_DISPLAY_BLOCKS)
+        self.log_widget.setCenterOnScroll(False)
+        self.log_widget.setStyleSheet(_LOG_STYLE)
         main_layout.addWidget(self.log_widget)
         
         # 进度条
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         main_layout.addWidget(self.progress_bar)
+        self._busy_timer = QTimer(self)
+        self._busy_timer.setSingleShot(True)
+        self._busy_timer.setInterval(self.BUSY_INDICATOR_DELAY_MS)
+        self._busy_timer.timeout.connect(self._show_busy_indicator)
         
         # 状态栏
-        self.statusBar().showMessage("正在启动...")
+        self._show_status("正在启动...")
+    
+    def _show_status(self, message: str):
+        """更新状态栏文本，内容未变化时跳过以减少重绘"""
+        status_bar = self.statusBar()
+        if status_bar.currentMessage() != message:
+            status_bar.showMessage(message)
+    
+    def _set_busy(self, busy: bool):
+        """显示/隐藏无限进度条：操作超过 BUSY_INDICATOR_DELAY_MS 仍未结束才显示，避免短操作触发动画重绘"""
+        if busy:
+            if self.progress_bar.isHidden() and not self._busy_timer.isActive():
+                self._busy_timer.start()
+        else:
+            self._busy_timer.stop()
+            if not self.progress_bar.isHidden():
+                self.progress_bar.setVisible(False)
+    
+    def _show_busy_indicator(self):
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
     
     def toggle_log_display(self):
         """切换日志显示状态"""
@@ -612,22 +977,33 @@ class NetworkAdapterGUI(QMainWindow):
         else:
             self.log_widget.setVisible(True)
             self.log_btn.setText("隐藏日志")
-            all_logs = gui_log_handler.get_all_logs()
-            if all_logs:
-                self.log_widget.setPlainText(all_logs)
-                cursor = self.log_widget.textCursor()
-                cursor.movePosition(cursor.End)
-                self.log_widget.setTextCursor(cursor)
-            self.resize(500, 620)
             self.log_visible = True
+            # 只追加隐藏期间产生的新日志，已显示的内容保留在控件中
+            self._flush_log_buffer()
+            self.resize(500, 620)
     
-    def append_log_message(self, message):
-        """实时添加日志消息"""
-        if self.log_visible:
-            self.log_widget.append(message)
-            cursor = self.log_widget.textCursor()
-            cursor.movePosition(cursor.End)
-            self.log_widget.setTextCursor(cursor)
+    def _flush_log_buffer(self):
+        """批量添加缓存的日志消息（由定时器在主线程调用）"""
+        if not self.log_visible:
+            return
+        # 超出面板行数上限的旧日志会被控件丢弃，不必格式化
+        entries, self._log_flushed_idx = gui_log_handler.get_logs_since(
+            self._log_flushed_idx, GuiLogHandler.MAX_DISPLAY_BLOCKS)
+        if not entries:
+            return
+        # 整批日志在一个编辑块中插入，只触发一次布局和重绘
+        scrollbar = self.log_widget.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        document = self.log_widget.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not document.isEmpty():
+            cursor.insertBlock()
+        cursor.insertText('\n'.join(entries))
+        cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
     
     def refresh_adapters(self):
         """刷新适配器列表"""
@@ -635,40 +1011,53 @@ class NetworkAdapterGUI(QMainWindow):
             QMessageBox.warning(self, "警告", "请等待初始化完成")
             return
         
-        if self.refresh_thread and self.refresh_thread.isRunning():
-            logging.info("停止当前刷新线程")
-            self.refresh_thread.quit()
-            self.refresh_thread.wait()
+        if self._refresh_running:
+            # 连续触发的刷新合并为当前刷新完成后的一次
+            logging.info("已有刷新任务在执行，完成后再刷新一次")
+            self._refresh_pending = True
+            return
         
         self.refresh_btn.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
+        self._set_busy(True)
         
-        logging.info("启动刷新适配器线程")
-        self.refresh_thread = RefreshThread(self.adapter)
-        self.refresh_thread.finished.connect(self.on_refresh_finished)
-        self.refresh_thread.progress_update.connect(self.on_progress_update)
-        self.refresh_thread.start()
+        logging.info("提交刷新适配器任务")
+        self._refresh_running = True
+        QMetaObject.invokeMethod(self._worker, "refresh", Qt.QueuedConnection)
+    
+    def _on_refresh_clicked(self):
+        """手动刷新：同时丢弃会话内缓存的支持选项（如驱动更新后可能变化）"""
+        self._speed_duplex_options_cache.clear()
+        self.refresh_adapters()
     
-    def on_refresh_finished(self, success, error_msg, adapters):
+    def on_refresh_finished(self, success, error_msg):
         """刷新完成处理"""
+        adapters = self._worker.take_result_adapters()
+        self._refresh_running = False
         self.refresh_btn.setEnabled(True)
-        self.progress_bar.setVisible(False)
+        self._set_busy(False)
+        
+        if self._refresh_pending:
+            # 本次结果可能已过时，直接执行合并后的刷新
+            self._refresh_pending = False
+            self.refresh_adapters()
+            return
         
         if success:
             logging.info("刷新适配器成功")
+            self._invalidate_speed_duplex_cache()
+            self._seed_speed_duplex_cache(adapters)
             self.update_adapter_list(adapters)
             # 若存在动态刷新序列，检查是否需要继续
             self._maybe_continue_dynamic_refresh()
         else:
-            logging.error(f"刷新适配器失败: {error_msg}")
-            self.statusBar().showMessage("刷新失败")
+            logging.error("刷新适配器失败: %s", error_msg)
+            self._show_status("刷新失败")
             # 自动重试一次：先尝试重连WMI，然后延时重新刷新
             try:
                 if self.adapter:
                     self.adapter.reconnect_wmi()
             except Exception as e:
-                logging.warning(f"重连WMI失败: {e}")
+                logging.warning("重连WMI失败: %s", e)
             
             def retry_once():
                 logging.info("自动重试刷新适配器...")
@@ -678,8 +1067,11 @@ class NetworkAdapterGUI(QMainWindow):
             # 同时提示用户本次失败，但会自动重试
             QMessageBox.information(self, "正在重试", f"刷新失败，将自动重试一次。\n\n原因: {error_msg}")
 
-    def _maybe_continue_dynamic_refresh(self):
-        """在动态刷新序列中，根据当前设置是否已生效决定是否继续下一次刷新。"""
+    def _maybe_continue_dynamic_refresh(self, current: str = None):
+        """在动态刷新序列中，根据当前设置是否已生效决定是否继续下一次刷新。
+        
+        current 为空时先查缓存；缓存未命中则在线程池中查询，结果返回后再调用本方法。
+        """
         if not self._dynamic_refresh_active:
             return
         alias = self._dynamic_target_alias
@@ -688,15 +1080,16 @@ class NetworkAdapterGUI(QMainWindow):
             # 无法判断，终止序列
             self._dynamic_refresh_active = False
             return
-        try:
-            current = self.settings.get_current_speed_duplex(alias)
-        except Exception as e:
-            logging.warning(f"检查当前速度双工失败: {e}")
-            current = None
+        if current is None:
+            current = self._lookup_speed_duplex_cache(alias)
+            if current is None:
+                self._dynamic_check_pending = True
+                self._start_status_lookup(alias, need_value=True, need_options=False)
+                return
         
         # 对比是否已达成目标（去除首尾空格）
         if current and target and current.strip() == target.strip():
-            self.statusBar().showMessage("设置已生效")
+            self._show_status("设置已生效")
             self._dynamic_refresh_active = False
             # 刷新确认成功后再弹窗提示
             if self._pending_success_message:
@@ -704,103 +1097,213 @@ class NetworkAdapterGUI(QMainWindow):
                 self._pending_success_message = None
             return
         
-        # 尚未生效，继续下一次刷新（两档：800ms -> 1500ms）
-        if self._dynamic_attempt_idx == 0:
-            # 第二次：+1500ms（兜底）
-            self._dynamic_attempt_idx = 1
-            QTimer.singleShot(1500, self.refresh_adapters)
-            self.statusBar().showMessage("最后一次刷新以确认设置...")
+        # 尚未生效，按退避间隔继续下一次刷新
+        self._dynamic_attempt_idx += 1
+        if self._dynamic_attempt_idx < len(self.DYNAMIC_REFRESH_BACKOFF_MS):
+            QTimer.singleShot(self.DYNAMIC_REFRESH_BACKOFF_MS[self._dynamic_attempt_idx], self._refresh_dynamic_target)
+            if self._dynamic_attempt_idx == len(self.DYNAMIC_REFRESH_BACKOFF_MS) - 1:
+                self._show_status("最后一次刷新以确认设置...")
+            else:
+                self._show_status("正在确认设置是否生效...")
         else:
-            # 两次之后仍未变化，结束并给出提示
+            # 所有间隔用完仍未变化，结束并给出提示
             self._dynamic_refresh_active = False
-            self.statusBar().showMessage("设置可能未立即生效，可稍后手动刷新或尝试重启适配器")
+            self._show_status("设置可能未立即生效，可稍后手动刷新或尝试重启适配器")
             # 不弹出成功提示，避免误导；清理待提示信息
             self._pending_success_message = None
     
     def update_adapter_list(self, adapters):
         """更新适配器列表显示"""
         current_selection = self.adapter_combo.currentText()
-        
-        self.current_adapters = adapters or []
-        self.adapter_combo.clear()
-        self.adapter_combo.setEnabled(True)
-        
-        # 根据开关过滤无线网卡（名称包含 Wireless 或 Wi-Fi 或 WLAN 等常见关键字）
-        def is_wireless(name: str) -> bool:
-            if not name:
-                return False
-            low = name.lower()
-            return ('wireless' in low) or ('wi-fi' in low) or ('wifi' in low) or ('wlan' in low)
-        
+        adapters = adapters or []
+        data_changed = adapters is not self.current_adapters
+        self.current_adapters = adapters
+        if data_changed:
+            self._name_to_adapter = {}
+            for adapter in adapters:
+                self._name_to_adapter.setdefault(adapter.name, adapter)
+        
+        # 根据开关过滤无线网卡（is_wireless 在刷新时已按名称关键字标记）
         show_wired_only = getattr(self, 'wired_only_checkbox', None) and self.wired_only_checkbox.isChecked()
-        filtered = []
-        for a in self.current_adapters:
-            if show_wired_only and is_wireless(a.get('name', '')):
-                continue
-            filtered.append(a)
+        if show_wired_only:
+            filtered = [a for a in self.current_adapters if not a.is_wireless]
+        else:
+            filtered = list(self.current_adapters)
+        
+        # 可见适配器（按alias）未变化时不重建下拉框，只更新名称有变化的行
+        fingerprint = tuple(a.alias for a in filtered)
+        if fingerprint == self._last_list_fingerprint and self.adapter_combo.isEnabled():
+            self._update_combo_names(filtered)
+            self._sync_selected_adapter()
+            if data_changed:
+                # 新的刷新数据可能包含IP等变化，仍需更新一次状态显示
+                self._debounced_adapter_changed()
+            return
+        self._last_list_fingerprint = fingerprint
         
-        if filtered:
-            for adapter in filtered:
-                self.adapter_combo.addItem(adapter['name'], userData=adapter.get('alias'))
+        # 重建列表期间屏蔽信号，避免每次 addItem 都触发选择变化处理（异常时也会自动恢复）
+        with QSignalBlocker(self.adapter_combo):
+            self.adapter_combo.clear()
+            self.adapter_combo.setEnabled(True)
             
-            if current_selection and current_selection not in ["正在初始化...", "请等待初始化完成"]:
-                index = self.adapter_combo.findText(current_selection)
-                if index >= 0:
-                    self.adapter_combo.setCurrentIndex(index)
-            
-            self.statusBar().showMessage(f"找到 {len(filtered)} 个适配器")
-        else:
-            self.adapter_combo.addItem("未找到可用的网络适配器")
-            self.statusBar().showMessage("未找到可用的网络适配器")
+            self._name_to_index = {}
+            if filtered:
+                for index, adapter in enumerate(filtered):
+                    self.adapter_combo.addItem(adapter.name, userData=adapter.alias)
+                    self._name_to_index.setdefault(adapter.name, index)
+                
+                # 按名称恢复之前的选择，找不到时保持第一项
+                self.adapter_combo.setCurrentIndex(self._name_to_index.get(current_selection, 0))
+                
+                self._show_status(f"找到 {len(filtered)} 个适配器")
+            else:
+                self.adapter_combo.addItem("未找到可用的网络适配器")
+                self._show_status("未找到可用的网络适配器")
+        
+        self._sync_selected_adapter()
+        # 列表重建完成后，仅在选择或数据发生变化时触发一次选择变化处理
+        if data_changed or self.adapter_combo.currentText() != current_selection:
+            self._debounced_adapter_changed()
+    
+    def _update_combo_names(self, filtered):
+        """按行更新下拉框中名称变化的适配器，不触发选择变化信号"""
+        changed = [(i, a.name) for i, a in enumerate(filtered) if self.adapter_combo.itemText(i) != a.name]
+        if not changed:
+            return
+        with QSignalBlocker(self.adapter_combo):
+            for index, name in changed:
+                self.adapter_combo.setItemText(index, name)
+        self._name_to_index = {}
+        for index, adapter in enumerate(filtered):
+            self._name_to_index.setdefault(adapter.name, index)
+    
+    def _on_adapter_index_changed(self, index):
+        # 只在选中项变化时触发（改名不触发）；立即同步选中的适配器（应用设置时使用），状态查询则防抖后执行
+        self._selected_adapter = self._name_to_adapter.get(self.adapter_combo.itemText(index))
+        self._debounced_adapter_changed()
+    
+    def _sync_selected_adapter(self):
+        """列表重建或数据更新后（此时信号被屏蔽）重新同步选中的适配器"""
+        self._selected_adapter = self._name_to_adapter.get(self.adapter_combo.currentText())
+    
+    def _selected_alias(self):
+        adapter = self._selected_adapter
+        return (adapter.alias or adapter.name) if adapter is not None else None
     
     def on_adapter_changed(self):
         """适配器选择改变处理"""
         if not self.initialization_complete:
             return
             
-        current_text = self.adapter_combo.currentText()
-        current_alias = self.adapter_combo.currentData()
-        
-        if not current_text or not self.current_adapters:
+        adapter = self._selected_adapter
+        if adapter is None:
             return
         
-        for adapter in self.current_adapters:
-            if adapter['name'] == current_text:
-                alias = current_alias or adapter.get('alias') or adapter['name']
-                actual_speed_duplex = self.settings.get_current_speed_duplex(alias)
-                status_text = (f"当前状态: {actual_speed_duplex} | "
-                             f"IP: {adapter['ip_address']}")
-                self.status_label.setText(status_text)
-                self.update_speed_duplex_options(alias)
-                break
-    
-    def update_speed_duplex_options(self, adapter_alias: str):
-        """更新速度双工选项"""
-        if not adapter_alias or not adapter_alias.strip():
-            self.speed_duplex_combo.clear()
-            self.speed_duplex_combo.addItem("请先选择适配器")
+        alias = adapter.alias or adapter.name
+        value = self._lookup_speed_duplex_cache(alias)
+        options = self._speed_duplex_options_cache.get(alias)
+        if value is not None and options is not None:
+            self._show_adapter_status(adapter, value)
+            self.update_speed_duplex_options(alias, options)
             return
         
-        try:
-            current_selection = self.speed_duplex_combo.currentText()
-            options = self.adapter.get_speed_duplex_options(adapter_alias, use_fallback=True)
-            
-            self.speed_duplex_combo.clear()
-            self.speed_duplex_combo.setEnabled(True)
+        # 缓存未命中时在线程池中查询，完成后由 _on_adapter_status_ready 更新界面
+        if value is None:
+            self.status_label.setText(f"当前状态: 正在获取... | IP: {adapter.ip_address}")
+        else:
+            self._show_adapter_status(adapter, value)
+        self._start_status_lookup(alias, value is None, options is None)
+    
+    def _start_status_lookup(self, alias, need_value, need_options):
+        """在线程池中查询适配器状态，完成后由 _on_adapter_status_ready 处理"""
+        runnable = AdapterStatusRunnable(self.settings, self.adapter, alias, need_value, need_options)
+        runnable.signals.done.connect(self._on_adapter_status_ready)
+        self._status_runnables.add(runnable)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _show_adapter_status(self, adapter, speed_duplex):
+        self.status_label.setText(f"当前状态: {speed_duplex} | IP: {adapter.ip_address}")
+    
+    def _on_adapter_status_ready(self, alias, value, options):
+        """后台状态查询完成：写入缓存，若仍选中该适配器则更新界面"""
+        sender = self.sender()
+        self._status_runnables = {r for r in self._status_runnables if r.signals is not sender}
+        if value is not None:
+            self._store_speed_duplex(alias, value)
+        if options:
+            self._speed_duplex_options_cache[alias] = options
+        if self._dynamic_check_pending and alias == self._dynamic_target_alias:
+            self._dynamic_check_pending = False
+            self._maybe_continue_dynamic_refresh(value or 'Unknown')
+        
+        if alias != self._selected_alias():
+            return
+        if value is not None:
+            self._show_adapter_status(self._selected_adapter, value)
+        if options is not None:
+            self.update_speed_duplex_options(alias, options or DEFAULT_SPEED_DUPLEX_OPTIONS.copy())
+    
+    def _lookup_speed_duplex_cache(self, alias: str):
+        """返回未过期的当前速度双工缓存值，没有则返回None"""
+        cached = self._speed_duplex_cache.get(alias)
+        if cached and time.monotonic() - cached[0] < self.SPEED_DUPLEX_CACHE_TTL:
+            return cached[1]
+        return None
+    
+    def _store_speed_duplex(self, alias: str, value: str, now: float = None):
+        if len(self._speed_duplex_cache) >= self.SPEED_DUPLEX_CACHE_SIZE and alias not in self._speed_duplex_cache:
+            # 淘汰最早写入的条目
+            self._speed_duplex_cache.pop(next(iter(self._speed_duplex_cache)))
+        self._speed_duplex_cache[alias] = (time.monotonic() if now is None else now, value)
+    
+    def _invalidate_speed_duplex_cache(self, alias: str = None):
+        """清除当前速度双工缓存：指定 alias 时只清除该适配器（设置变更后），否则全部清除（刷新后）"""
+        if alias is None:
+            self._speed_duplex_cache.clear()
+        else:
+            self._speed_duplex_cache.pop(alias, None)
+    
+    def _seed_speed_duplex_cache(self, adapters):
+        """用批量刷新结果填充速度双工缓存和支持选项缓存，切换适配器时无需再单独查询"""
+        now = time.monotonic()
+        for adapter in adapters:
+            value = adapter.actual_speed_duplex
+            alias = adapter.alias
+            if not alias:
+                continue
+            if value and value != 'Unknown':
+                self._store_speed_duplex(alias, value, now)
+            if adapter.speed_duplex_options:
+                self._speed_duplex_options_cache[alias] = adapter.speed_duplex_options
+    
+    def update_speed_duplex_options(self, adapter_alias: str, options: list):
+        """用已查询到的选项更新速度双工下拉框"""
+        # 重建期间屏蔽信号，clear/addItems/setCurrentText 不逐项发出 currentTextChanged
+        with QSignalBlocker(self.speed_duplex_combo):
+            if not adapter_alias or not adapter_alias.strip():
+                self.speed_duplex_combo.clear()
+                self.speed_duplex_combo.addItem("请先选择适配器")
+                return
             
-            if options:
-                self.speed_duplex_combo.addItems(options)
-                if current_selection in options:
-                    self.speed_duplex_combo.setCurrentText(current_selection)
-                else:
-                    self.speed_duplex_combo.setCurrentIndex(0)
-            else:
-                self.speed_duplex_combo.addItem("无可用选项")
+            try:
+                current_selection = self.speed_duplex_combo.currentText()
                 
-        except Exception as e:
-            logging.warning(f"更新速度双工选项失败: {str(e)}")
-            self.speed_duplex_combo.clear()
-            self.speed_duplex_combo.addItem("获取选项失败")
+                self.speed_duplex_combo.clear()
+                self.speed_duplex_combo.setEnabled(True)
+                
+                if options:
+                    self.speed_duplex_combo.addItems(options)
+                    if current_selection in options:
+                        self.speed_duplex_combo.setCurrentText(current_selection)
+                    else:
+                        self.speed_duplex_combo.setCurrentIndex(0)
+                else:
+                    self.speed_duplex_combo.addItem("无可用选项")
+                    
+            except Exception as e:
+                logging.warning("更新速度双工选项失败: %s", e)
+                self.speed_duplex_combo.clear()
+                self.speed_duplex_combo.addItem("获取选项失败")
     
     def apply_settings(self):
         """应用网络设置"""
@@ -808,7 +1311,8 @@ class NetworkAdapterGUI(QMainWindow):
             QMessageBox.warning(self, "警告", "请等待初始化完成")
             return
             
-        if not self.adapter_combo.currentText():
+        adapter = self._selected_adapter
+        if adapter is None:
             QMessageBox.warning(self, "警告", "请先选择一个网络适配器")
             return
         
@@ -816,8 +1320,8 @@ class NetworkAdapterGUI(QMainWindow):
             QMessageBox.warning(self, "权限不足", "需要管理员权限才能修改网络设置")
             return
         
-        adapter_name = self.adapter_combo.currentText()
-        adapter_alias = self.adapter_combo.currentData() or adapter_name
+        adapter_name = adapter.name
+        adapter_alias = adapter.alias or adapter_name
         speed_duplex = self.speed_duplex_combo.currentText()
         
         reply = QMessageBox.question(self, "确认操作", 
@@ -832,27 +1336,34 @@ class NetworkAdapterGUI(QMainWindow):
         """启动后台操作"""
         self.apply_btn.setEnabled(False)
         self.refresh_btn.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)
-        self.statusBar().showMessage("正在应用设置...")
+        self._set_busy(True)
+        self._show_status("正在应用设置...")
         
-        self.worker_thread = WorkerThread(self.settings, self.adapter, adapter_name, speed_duplex)
-        self.worker_thread.finished.connect(self.on_operation_finished)
-        self.worker_thread.progress_update.connect(self.on_progress_update)
-        self.worker_thread.start()
+        QMetaObject.invokeMethod(self._worker, "apply", Qt.QueuedConnection,
+                                 Q_ARG(str, adapter_name), Q_ARG(str, speed_duplex))
+    
+    def on_apply_succeeded(self, adapter_name, message):
+        """设置已写入，延时后再让后台线程获取更新后的状态"""
+        QTimer.singleShot(self.APPLY_SETTLE_DELAY_MS,
+                          lambda: self._post_apply_fetch(adapter_name, message))
+    
+    def _post_apply_fetch(self, adapter_name, message):
+        if self._worker_thread and self._worker_thread.isRunning():
+            QMetaObject.invokeMethod(self._worker, "fetch_status", Qt.QueuedConnection,
+                                     Q_ARG(str, adapter_name), Q_ARG(str, message))
     
     def on_operation_finished(self, success, message, status_data):
         """操作完成处理"""
         self.apply_btn.setEnabled(True)
         self.refresh_btn.setEnabled(True)
-        self.progress_bar.setVisible(False)
+        self._set_busy(False)
         
         if success:
-            self.statusBar().showMessage("设置应用成功，正在刷新状态...")
+            self._show_status("设置应用成功，正在刷新状态...")
             # 延后弹窗：待刷新确认后再提示成功
             self._pending_success_message = message
             # 从 status_data 或按钮当前选择推断目标
-            selected_alias = self.adapter_combo.currentData() or self.adapter_combo.currentText()
+            selected_alias = self._selected_alias()
             target_value = self.speed_duplex_combo.currentText()
             try:
                 if status_data and isinstance(status_data, list) and status_data:
@@ -863,6 +1374,7 @@ class NetworkAdapterGUI(QMainWindow):
                         target_value = maybe['new_status']
             except Exception:
                 pass
+            self._invalidate_speed_duplex_cache(selected_alias)
             
             # 设置动态刷新状态
             self._dynamic_refresh_active = True
@@ -870,92 +1382,188 @@ class NetworkAdapterGUI(QMainWindow):
             self._dynamic_target_value = target_value
             self._dynamic_attempt_idx = 0
             
-            # 第一次刷新：800ms
-            QTimer.singleShot(800, self.refresh_adapters)
+            if self._adapter_watcher_ok:
+                # 只在等待确认期间订阅适配器变化事件，事件到达或超时后取消订阅
+                self._start_adapter_watcher()
+                self._awaiting_adapter_event = True
+                QTimer.singleShot(self.ADAPTER_EVENT_TIMEOUT_MS, self._on_adapter_event_timeout)
+            else:
+                QTimer.singleShot(self.DYNAMIC_REFRESH_BACKOFF_MS[0], self._refresh_dynamic_target)
         else:
-            self.statusBar().showMessage("设置应用失败")
+            self._show_status("设置应用失败")
             QMessageBox.critical(self, "失败", message)
     
+    def _start_adapter_watcher(self):
+        """启动WMI适配器事件监听线程（已在监听时不重复启动）
+
+        订阅期间WMI每秒都要重新枚举适配器，因此只在等待设置生效时订阅，见 _stop_adapter_watcher。
+        """
+        if self._adapter_watcher is not None:
+            return
+        watcher = AdapterEventWorker(self)
+        watcher.adapter_changed.connect(self.on_adapter_event)
+        watcher.watch_failed.connect(self._on_adapter_watch_failed)
+        watcher.finished.connect(watcher.deleteLater)
+        self._adapter_watcher = watcher
+        watcher.start()
+    
+    def _stop_adapter_watcher(self):
+        """取消适配器事件订阅：线程在下一次等待超时后退出，结束后自行释放"""
+        watcher, self._adapter_watcher = self._adapter_watcher, None
+        if watcher is not None:
+            watcher.requestInterruption()
+    
+    def _on_adapter_watch_failed(self, error):
+        """事件订阅不可用，回退到定时刷新；若正在等待事件则立即刷新"""
+        if self.sender() is not self._adapter_watcher:
+            return  # 已取消订阅的旧线程
+        self._adapter_watcher = None
+        self._adapter_watcher_ok = False
+        self._on_adapter_event_timeout()
+    
+    def on_adapter_event(self, alias, status):
+        """收到适配器变化事件：若正等待目标适配器变化，则刷新一次"""
+        if not self._awaiting_adapter_event:
+            return
+        if self._dynamic_target_alias and alias != self._dynamic_target_alias:
+            return
+        self._awaiting_adapter_event = False
+        self._stop_adapter_watcher()
+        self._refresh_dynamic_target()
+    
+    def _on_adapter_event_timeout(self):
+        if self._awaiting_adapter_event:
+            self._awaiting_adapter_event = False
+            self._stop_adapter_watcher()
+            self._refresh_dynamic_target()
+    
+    def _refresh_dynamic_target(self):
+        """只刷新正在确认设置的适配器，结果由 on_adapter_refreshed 处理"""
+        alias = self._dynamic_target_alias
+        if not alias or not (self._worker_thread and self._worker_thread.isRunning()):
+            self.refresh_adapters()
+            return
+        QMetaObject.invokeMethod(self._worker, "refresh_one", Qt.QueuedConnection, Q_ARG(str, alias))
+    
+    def on_adapter_refreshed(self, alias, info):
+        """用单个适配器的查询结果就地更新列表，不重建下拉框"""
+        index = next((i for i, a in enumerate(self.current_adapters) if (a.alias or a.name) == alias), None)
+        if info is None or index is None:
+            # 查询失败或适配器不在当前列表中，退回完整刷新
+            self.refresh_adapters()
+            return
+        
+        old = self.current_adapters[index]
+        old_name = old.name
+        self.current_adapters[index] = info
+        if self._name_to_adapter.get(old_name) is old:
+            del self._name_to_adapter[old_name]
+        self._name_to_adapter.setdefault(info.name, info)
+        self._invalidate_speed_duplex_cache(alias)
+        self._seed_speed_duplex_cache([info])
+        if info.name != old_name:
+            combo_index = self._name_to_index.pop(old_name, None)
+            if combo_index is not None:
+                self.adapter_combo.setItemText(combo_index, info.name)
+                self._name_to_index[info.name] = combo_index
+        
+        if self._selected_adapter is old:
+            self._selected_adapter = info
+        if self._selected_alias() == alias:
+            self._debounced_adapter_changed()
+        self._maybe_continue_dynamic_refresh()
+    
     def on_progress_update(self, message):
         """更新进度信息"""
-        logging.info(f"进度更新: {message}")
-        self.statusBar().showMessage(message)
+        # 进度文本已显示在状态栏，且多数紧跟在同内容的 INFO 日志之后，只在调试时记录
+        logging.debug("进度更新: %s", message)
+        self._show_status(message)
+    
+    def show_system_diagnosis(self, force: bool = False):
+        """显示系统诊断对话框（使用缓存的兼容性报告，force=True 时重新检测）"""
+        waited = self._compat_report is None or force
+        if waited:
+            self._show_status("正在进行系统诊断...")
+            self._set_busy(True)
+        self._request_compat_report(
+            functools.partial(self._show_system_diagnosis_dialog, waited), force=force)
     
-    def show_system_diagnosis(self):
-        """显示系统诊断对话框"""
+    def _show_system_diagnosis_dialog(self, waited, report):
+        """根据兼容性报告显示系统诊断对话框，waited 表示是否为此等待了后台检测"""
+        if waited:
+            if not self._refresh_running:
+                self._set_busy(False)
+            self._show_status("系统诊断完成")
         try:
-            compatibility = SystemCompatibility()
-            report = compatibility.get_compatibility_report()
+            if report is None:
+                raise Exception("兼容性检查失败")
             
             # 构建诊断报告文本
-            diag_text = "系统兼容性诊断报告\n"
-            diag_text += "=" * 40 + "\n\n"
-            
-            # 系统信息
-            diag_text += "系统信息:\n"
             sys_info = report['system_info']
-            diag_text += f"  平台: {sys_info.get('platform', 'Unknown')}\n"
-            diag_text += f"  Python版本: {sys_info.get('python_version', 'Unknown').split()[0]}\n"
-            diag_text += f"  管理员权限: {'是' if sys_info.get('is_admin', False) else '否'}\n\n"
-            
-            # PowerShell信息
-            diag_text += "PowerShell兼容性:\n"
             ps_info = report['powershell']
-            diag_text += f"  可用性: {'是' if ps_info['available'] else '否'}\n"
+            wmi_info = report['wmi']
+            net_info = report['network_commands']
+            
+            parts = [
+                "系统兼容性诊断报告",
+                "=" * 40,
+                "",
+                # 系统信息
+                "系统信息:",
+                f"  平台: {sys_info.get('platform', 'Unknown')}",
+                f"  Python版本: {sys_info.get('python_version', 'Unknown').split()[0]}",
+                f"  管理员权限: {'是' if sys_info.get('is_admin', False) else '否'}",
+                "",
+                # PowerShell信息
+                "PowerShell兼容性:",
+                f"  可用性: {'是' if ps_info['available'] else '否'}",
+            ]
             if ps_info['available']:
-                diag_text += f"  路径: {ps_info['path']}\n"
-                diag_text += f"  版本: {ps_info['version']}\n"
-                diag_text += f"  执行策略: {ps_info['execution_policy']}\n"
-            diag_text += "\n"
+                parts.append(f"  路径: {ps_info['path']}")
+                parts.append(f"  版本: {ps_info['version']}")
+                parts.append(f"  执行策略: {ps_info['execution_policy']}")
+            parts.append("")
             
             # WMI信息
-            diag_text += "WMI兼容性:\n"
-            wmi_info = report['wmi']
-            diag_text += f"  可用性: {'是' if wmi_info['available'] else '否'}\n"
-            diag_text += f"  服务运行: {'是' if wmi_info['service_running'] else '否'}\n"
+            parts.append("WMI兼容性:")
+            parts.append(f"  可用性: {'是' if wmi_info['available'] else '否'}")
+            parts.append(f"  服务运行: {'是' if wmi_info['service_running'] else '否'}")
             if wmi_info['error']:
-                diag_text += f"  错误: {wmi_info['error']}\n"
-            diag_text += "\n"
+                parts.append(f"  错误: {wmi_info['error']}")
+            parts.append("")
             
             # 网络命令兼容性
-            diag_text += "网络命令兼容性:\n"
-            net_info = report['network_commands']
-            diag_text += f"  netsh: {'可用' if net_info['netsh_available'] else '不可用'}\n"
-            diag_text += f"  Get-NetAdapter: {'可用' if net_info['get_netadapter_available'] else '不可用'}\n"
-            diag_text += f"  wmic: {'可用' if net_info['wmic_available'] else '不可用'}\n\n"
+            parts.append("网络命令兼容性:")
+            parts.append(f"  netsh: {'可用' if net_info['netsh_available'] else '不可用'}")
+            parts.append(f"  Get-NetAdapter: {'可用' if net_info['get_netadapter_available'] else '不可用'}")
+            parts.append(f"  wmic: {'可用' if net_info['wmic_available'] else '不可用'}")
+            parts.append("")
             
             # 建议
             if report['recommendations']:
-                diag_text += "建议:\n"
-                for i, rec in enumerate(report['recommendations'], 1):
-                    diag_text += f"  {i}. {rec}\n"
-            
-            # 创建对话框
-            msg_box = QMessageBox(self)
-            msg_box.setWindowTitle("系统诊断")
-            msg_box.setText("系统兼容性诊断完成")
-            msg_box.setDetailedText(diag_text)
-            msg_box.setIcon(QMessageBox.Information)
-            
-            # 设置对话框大小，让详细信息区域更大
-            msg_box.resize(800, 600)
+                parts.append("建议:")
+                parts.extend(f"  {i}. {rec}" for i, rec in enumerate(report['recommendations'], 1))
+                parts.append("")
             
-            # 查找详细文本区域并设置最小大小
-            for widget in msg_box.findChildren(QTextEdit):
-                widget.setMinimumSize(750, 400)
-                widget.setMaximumSize(750, 400)
+            diag_text = "\n".join(parts)
             
-            msg_box.exec_()
+            # 对话框只创建一次，之后只更新报告文本
+            if self._diag_dialog is None:
+                self._diag_dialog = DiagnosisDialog(self)
+            if self._diag_dialog.show_report(diag_text):
+                self.show_system_diagnosis(force=True)
             
         except Exception as e:
             QMessageBox.critical(self, "错误", f"系统诊断失败: {str(e)}")
     
     def show_about(self):
-        """显示关于对话框"""
-        from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QScrollArea
-        from PyQt5.QtCore import QUrl
-        from PyQt5.QtGui import QDesktopServices
-        
+        """显示关于对话框（首次打开时创建，之后复用）"""
+        if self._about_dialog is None:
+            self._about_dialog = self._build_about_dialog()
+        self._about_dialog.exec_()
+    
+    def _build_about_dialog(self):
+        """创建关于对话框"""
         # 创建自定义对话框
         dialog = QDialog(self)
         dialog.setWindowTitle("关于")
@@ -970,13 +1578,13 @@ class NetworkAdapterGUI(QMainWindow):
         
         # 标题
         title_label = QLabel("网络适配器管理工具 v1.1")
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin: 10px 0;")
+        title_label.setStyleSheet(_ABOUT_TITLE_STYLE)
         scroll_layout.addWidget(title_label)
         
         # 描述
         desc_label = QLabel("Windows系统网络适配器速度和双工模式管理工具，支持图形化界面操作。\n为NA（广软网协）而做")
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("margin: 10px 0;")
+        desc_label.setStyleSheet(_ABOUT_DESC_STYLE)
         scroll_layout.addWidget(desc_label)
         
         # 功能特性
@@ -1006,30 +1614,11 @@ class NetworkAdapterGUI(QMainWindow):
 
 许可证: MIT License"""
         
-        features_label = QLabel(features_text)
-        features_label.setWordWrap(True)
-        features_label.setStyleSheet("margin: 10px 0;")
-        scroll_layout.addWidget(features_label)
+        scroll_layout.addWidget(FeaturesView(features_text, 440))
         
         # GitHub链接按钮
         github_btn = QPushButton("🔗 项目地址: https://github.com/CurtisYan/NetAdapterTool")
-        github_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0366d6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                text-align: left;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #0256cc;
-            }
-            QPushButton:pressed {
-                background-color: #024ea4;
-            }
-        """)
+        github_btn.setStyleSheet(_GITHUB_BTN_STYLE)
         github_btn.clicked.connect(lambda: QDesktopServices.openUrl(QUrl("https://github.com/CurtisYan/NetAdapterTool")))
         scroll_layout.addWidget(github_btn)
         
@@ -1043,42 +1632,60 @@ class NetworkAdapterGUI(QMainWindow):
         close_btn.clicked.connect(dialog.accept)
         layout.addWidget(close_btn)
         
-        dialog.exec_()
+        return dialog
     
     def closeEvent(self, event):
         """关闭程序处理"""
         logging.info("程序关闭中...")
         
-        # 停止所有线程
-        threads = [self.worker_thread, self.refresh_thread, self.init_thread]
+        # 先通知所有线程退出，再结束常驻PowerShell进程，使阻塞在命令上的线程立即返回
+        # 包括已取消订阅、尚未退出的适配器事件线程
+        threads = [t for t in self.findChildren(QThread) if t.isRunning()]
         for thread in threads:
-            if thread and thread.isRunning():
-                thread.quit()
-                thread.wait(3000)  # 最多等待3秒
+            thread.requestInterruption()
+            thread.quit()
+        PowerShellSession.get().terminate()
+        
+        # 所有线程共用一个等待时限，而不是逐个等待
+        deadline = time.monotonic() + self.SHUTDOWN_WAIT_MS / 1000
+        for thread in threads:
+            if not thread.wait(max(int((deadline - time.monotonic()) * 1000), 0)):
+                # 仍阻塞在WMI调用中：不能随窗口一起销毁正在运行的QThread（Qt会直接中止程序），
+                # 解除父对象并把所有权交给C++，线程结束后自行释放
+                logging.debug("后台线程未能及时退出，转为结束后自行释放")
+                thread.setParent(None)
+                sip.transferto(thread, None)
+                thread.finished.connect(thread.deleteLater)
+        QThreadPool.globalInstance().waitForDone(max(int((deadline - time.monotonic()) * 1000), 0))
+        
+        # 释放WMI连接
+        if self.adapter:
+            self.adapter.wmi_conn = None
         
         logging.info("程序已关闭")
         event.accept()
 
 
+def _hide_console_window():
+    """源码运行时隐藏控制台窗口；打包后的窗口程序没有控制台，直接跳过"""
+    if getattr(sys, 'frozen', False):
+        return
+    try:
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        user32 = ctypes.WinDLL('user32', use_last_error=True)
+        console_window = kernel32.GetConsoleWindow()
+        if console_window:
+            # 隐藏控制台窗口 (SW_HIDE = 0)
+            user32.ShowWindow(console_window, 0)
+    except Exception:
+        # 如果隐藏失败，继续运行程序
+        pass
+
+
 def main():
+    _setup_logging()
     try:
-        # 隐藏控制台窗口
-        try:
-            import ctypes
-            import ctypes.wintypes
-            
-            # 获取控制台窗口句柄
-            kernel32 = ctypes.windll.kernel32
-            user32 = ctypes.windll.user32
-            
-            # 获取当前进程的控制台窗口
-            console_window = kernel32.GetConsoleWindow()
-            if console_window:
-                # 隐藏控制台窗口 (SW_HIDE = 0)
-                user32.ShowWindow(console_window, 0)
-        except Exception as e:
-            # 如果隐藏失败，继续运行程序
-            pass
+        _hide_console_window()
         
         print("Starting Network Adapter Tool...")
         print(f"Python version: {sys.version}")
@@ -1091,28 +1698,14 @@ def main():
         app.setApplicationVersion("1.1")
         print("QApplication created successfully")
         
-        # 设置应用程序图标
+        # 设置应用程序图标（路径与窗口图标共用同一缓存）
         try:
-            # 支持多种部署方式的图标路径查找
-            possible_icon_paths = [
-                os.path.join(os.path.dirname(__file__), "img", "NA.ico"),  # 源码运行
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), "img", "NA.ico"),  # 绝对路径
-                os.path.join(os.getcwd(), "img", "NA.ico"),  # 当前工作目录
-                "img/NA.ico",  # 相对路径
-                "NA.ico"  # 同目录
-            ]
-            
-            icon_loaded = False
-            for icon_path in possible_icon_paths:
-                print(f"Looking for icon at: {icon_path}")
-                if os.path.exists(icon_path):
-                    app.setWindowIcon(QIcon(icon_path))
-                    print("Icon loaded successfully")
-                    icon_loaded = True
-                    break
-            
-            if not icon_loaded:
-                print("Icon file not found in any location")
+            icon_path = _asset("NA.ico")
+            if icon_path:
+                app.setWindowIcon(QIcon(icon_path))
+                print("Icon loaded successfully")
+            else:
+                print("Icon file not found")
         except Exception as e:
             print(f"Icon loading error: {e}")
         
@@ -4,6 +4,9 @@
 """
 
 import wmi
+import atexit
+import ctypes
+import socket
 import subprocess
 import json
 import pythoncom
@@ -13,6 +16,15 @@ import logging
 from typing import List, Dict, Optional
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
+from powershell_session import (PowerShellSession, SessionClosed, available_powershell_paths, ps_quote,
+                                run_powershell_once)
+
+try:
+    import orjson  # 可选：C实现的JSON解析，速度更快
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # 默认速度双工选项（当无法从系统获取时使用）
 DEFAULT_SPEED_DUPLEX_OPTIONS = [
     "自动侦测", 
@@ -32,6 +44,195 @@ CONFIG = {
 }
 
 
+# 可重试的COM错误：RPC服务暂不可用或调用被拒绝，稍后重试可能成功；其他错误重试也不会成功
+_RETRYABLE_HRESULTS = frozenset({
+    -2147023174,  # 0x800706BA RPC_S_SERVER_UNAVAILABLE
+    -2147023170,  # 0x800706BE RPC_S_CALL_FAILED
+    -2147418111,  # 0x80010001 RPC_E_CALL_REJECTED
+    -2147417846,  # 0x8001010A RPC_E_SERVERCALL_RETRYLATER
+})
+
+
+def _retry_delay(attempt: int) -> float:
+    """第 attempt 次失败后的重试等待时间（秒）：从50毫秒开始指数增长，最多0.5秒"""
+    return min(0.05 * (1 << attempt), 0.5)
+
+
+class WMIConnectionError(Exception):
+    """WMI连接失败"""
+
+
+class WMITimeout(WMIConnectionError):
+    """WMI连接超时"""
+
+
+def _is_retryable_com_error(error: Exception) -> bool:
+    """判断异常（com_error 或包装了 com_error 的 wmi.x_wmi）是否值得重试"""
+    com_error = error if isinstance(error, pythoncom.com_error) else getattr(error, 'com_error', None)
+    args = getattr(com_error, 'args', None)
+    return bool(args) and args[0] in _RETRYABLE_HRESULTS
+
+
+class AdapterInfo:
+    """单个网络适配器的信息，使用 __slots__ 代替字典以减少内存占用"""
+    __slots__ = ('name', 'device_id', 'mac_address', 'alias', 'ip_address', 'status',
+                 'speed', 'duplex', 'media_type', 'actual_speed_duplex', 'speed_duplex_options',
+                 'is_wireless')
+    
+    def __init__(self, name: str, device_id: str, mac_address: str, alias: str,
+                 ip_address: str = 'Unknown', status=None, speed: str = 'Unknown',
+                 duplex: str = 'Unknown', media_type: Optional[str] = None,
+                 actual_speed_duplex: Optional[str] = None,
+                 speed_duplex_options: Optional[List[str]] = None):
+        self.name = name
+        self.device_id = device_id
+        self.mac_address = mac_address
+        self.alias = alias
+        self.ip_address = ip_address
+        self.status = status
+        self.speed = speed
+        self.duplex = duplex
+        self.media_type = media_type
+        self.actual_speed_duplex = actual_speed_duplex  # 批量查询时一并获取的当前速度双工设置
+        self.speed_duplex_options = speed_duplex_options  # 批量查询时一并获取的支持选项
+        self.is_wireless = False
+    
+    def __repr__(self):
+        return f"AdapterInfo(name={self.name!r}, alias={self.alias!r})"
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """获取模块共享的线程池，首次使用时创建"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=CONFIG['THREAD_POOL_SIZE'],
+                                               thread_name_prefix='na-')
+                atexit.register(_executor.shutdown, wait=False)
+    return _executor
+
+
+def _parse_json_items(output: str) -> list:
+    """解析 ConvertTo-Json 的输出，单个对象也统一返回列表"""
+    data = _json_loads(output)
+    if data is None:
+        return []
+    return data if isinstance(data, list) else [data]
+
+
+# FullDuplex 字段到显示文本：JSON中为布尔值，PowerShell直接输出时为 True/False 文本
+_DUPLEX_TEXT = {True: "全双工", False: "半双工", 'True': "全双工", 'False': "半双工"}
+
+
+def _duplex_text(full_duplex) -> str:
+    """把 Get-NetAdapter 的 FullDuplex 字段转换为显示文本"""
+    return _DUPLEX_TEXT.get(full_duplex, 'Unknown')
+
+
+# 适配器名称中包含这些词（不区分大小写，与WQL的LIKE一致）时视为虚拟/回环适配器，不显示；无线适配器保留
+_NAME_BLOCKLIST = ('virtual', 'loopback')
+
+
+def _is_excluded_name(name: str) -> bool:
+    """名称是否属于虚拟/回环适配器，每行只做一次小写转换"""
+    name_lower = name.lower()
+    return any(word in name_lower for word in _NAME_BLOCKLIST)
+
+
+class _SOCKET_ADDRESS(ctypes.Structure):
+    _fields_ = [('lpSockaddr', ctypes.c_void_p), ('iSockaddrLength', ctypes.c_int)]
+
+
+class _IP_ADAPTER_UNICAST_ADDRESS(ctypes.Structure):
+    pass
+
+
+_IP_ADAPTER_UNICAST_ADDRESS._fields_ = [
+    ('Length', ctypes.c_ulong),
+    ('Flags', ctypes.c_ulong),
+    ('Next', ctypes.POINTER(_IP_ADAPTER_UNICAST_ADDRESS)),
+    ('Address', _SOCKET_ADDRESS),
+]
+
+
+class _IP_ADAPTER_ADDRESSES(ctypes.Structure):
+    """IP_ADAPTER_ADDRESSES 的前半部分，只声明用到的字段（结构体由系统分配，无需完整声明）"""
+    pass
+
+
+_IP_ADAPTER_ADDRESSES._fields_ = [
+    ('Length', ctypes.c_ulong),
+    ('IfIndex', ctypes.c_ulong),
+    ('Next', ctypes.POINTER(_IP_ADAPTER_ADDRESSES)),
+    ('AdapterName', ctypes.c_char_p),
+    ('FirstUnicastAddress', ctypes.POINTER(_IP_ADAPTER_UNICAST_ADDRESS)),
+    ('FirstAnycastAddress', ctypes.c_void_p),
+    ('FirstMulticastAddress', ctypes.c_void_p),
+    ('FirstDnsServerAddress', ctypes.c_void_p),
+    ('DnsSuffix', ctypes.c_wchar_p),
+    ('Description', ctypes.c_wchar_p),
+    ('FriendlyName', ctypes.c_wchar_p),
+]
+
+_AF_INET = 2
+_GAA_FLAGS = 0x2 | 0x4 | 0x8  # GAA_FLAG_SKIP_ANYCAST | SKIP_MULTICAST | SKIP_DNS_SERVER
+_ERROR_BUFFER_OVERFLOW = 111
+
+
+def _ipv4_by_alias() -> Optional[Dict[str, str]]:
+    """通过 iphlpapi.GetAdaptersAddresses 在进程内获取每个适配器的第一个IPv4地址
+
+    返回 {连接名称(FriendlyName): IPv4地址}，没有IPv4地址的适配器不在其中；
+    API不可用（非Windows）或调用失败时返回None，调用方应改用PowerShell查询。
+    """
+    try:
+        get_adapters_addresses = ctypes.windll.iphlpapi.GetAdaptersAddresses
+    except (AttributeError, OSError):
+        return None
+    
+    size = ctypes.c_ulong(15 * 1024)  # 微软建议的初始缓冲区大小
+    for _ in range(3):
+        buf = ctypes.create_string_buffer(size.value)
+        ret = get_adapters_addresses(_AF_INET, _GAA_FLAGS, None, buf, ctypes.byref(size))
+        if ret != _ERROR_BUFFER_OVERFLOW:
+            break
+    if ret != 0:
+        logging.debug("GetAdaptersAddresses 调用失败: %s", ret)
+        return None
+    
+    ips = {}
+    node = ctypes.cast(buf, ctypes.POINTER(_IP_ADAPTER_ADDRESSES))
+    while node:
+        entry = node.contents
+        unicast = entry.FirstUnicastAddress
+        if entry.FriendlyName and unicast:
+            # sockaddr_in：2字节地址族、2字节端口之后是4字节IPv4地址
+            sockaddr = unicast.contents.Address.lpSockaddr
+            ips[entry.FriendlyName] = socket.inet_ntoa(ctypes.string_at(sockaddr + 4, 4))
+        node = entry.Next
+    return ips
+
+
+# PowerShell中按连接名称收集第一个IPv4地址的片段，GetAdaptersAddresses 不可用时才加入查询
+_PS_IP_MAP = (
+    "Get-NetIPAddress{filter} -AddressFamily IPv4 -ErrorAction SilentlyContinue | "
+    "ForEach-Object {{ if (-not $ip.ContainsKey($_.InterfaceAlias)) {{ $ip[$_.InterfaceAlias] = $_.IPAddress }} }}; "
+)
+
+
+def _ip_lookup(ps_filter: str = '') -> tuple:
+    """返回 (IP字典, PowerShell片段)：进程内API可用时片段为空，否则由PowerShell在同一次调用中收集IP"""
+    ips = _ipv4_by_alias()
+    if ips is not None:
+        return ips, ''
+    return {}, _PS_IP_MAP.format(filter=ps_filter)
+
+
 class NetworkAdapter:
     def __init__(self, lazy_init=True):
         """
@@ -62,25 +263,27 @@ class NetworkAdapter:
                     # 在多线程环境中初始化COM组件
                     try:
                         pythoncom.CoInitialize()
-                    except:
-                        pass  # 如果已经初始化过，忽略错误
+                    except pythoncom.com_error:
+                        pass  # 已用其他并发模型初始化过，忽略
                     
-                    # 使用线程池执行WMI初始化，带超时
-                    with ThreadPoolExecutor(max_workers=1) as executor:
-                        future = executor.submit(self._create_wmi_connection)
-                        self.wmi_conn = future.result(timeout=CONFIG['WMI_TIMEOUT'])
+                    # 在共享线程池中执行WMI初始化，带超时（超时后不等待该任务结束）
+                    future = _get_executor().submit(self._create_wmi_connection)
+                    self.wmi_conn = future.result(timeout=CONFIG['WMI_TIMEOUT'])
                     
                     self._initialized = True
                     return True
                     
                 except FutureTimeoutError:
                     if attempt == max_retries - 1:
-                        raise Exception(f"WMI连接超时，已重试{max_retries}次")
-                    time.sleep(1)
+                        raise WMITimeout(f"WMI连接超时，已重试{max_retries}次")
+                    time.sleep(_retry_delay(attempt))
                 except Exception as e:
+                    # 只有暂时性的RPC错误才重试，其他错误（服务被禁用、权限不足等）立即失败
+                    if not _is_retryable_com_error(e):
+                        raise WMIConnectionError(f"WMI连接失败: {str(e)}") from e
                     if attempt == max_retries - 1:
-                        raise Exception(f"WMI连接失败，已重试{max_retries}次: {str(e)}")
-                    time.sleep(1)
+                        raise WMIConnectionError(f"WMI连接失败，已重试{max_retries}次: {str(e)}") from e
+                    time.sleep(_retry_delay(attempt))
             
             return False
     
@@ -89,10 +292,11 @@ class NetworkAdapter:
         # 在新线程中必须初始化COM组件
         try:
             pythoncom.CoInitialize()
-        except:
-            pass  # 如果已经初始化过，忽略错误
+        except pythoncom.com_error:
+            pass  # 已用其他并发模型初始化过，忽略
         
-        return wmi.WMI()
+        # 只用到少数几个类，跳过连接时的类枚举
+        return wmi.WMI(find_classes=False)
     
     def reconnect_wmi(self):
         """重新连接WMI"""
@@ -103,7 +307,7 @@ class NetworkAdapter:
         # 在重连前也初始化COM组件
         try:
             pythoncom.CoInitialize()
-        except:
+        except pythoncom.com_error:
             pass
             
         return self._init_wmi_connection()
@@ -129,39 +333,23 @@ class NetworkAdapter:
         if timeout is None:
             timeout = CONFIG['POWERSHELL_TIMEOUT']
         
-        # 尝试多种PowerShell路径，提高兼容性
-        powershell_paths = [
-            'powershell',  # 系统PATH中的PowerShell
-            r'C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe',  # Windows PowerShell 5.x
-            r'C:\Program Files\PowerShell\7\pwsh.exe',  # PowerShell 7.x
-            r'C:\Program Files (x86)\PowerShell\7\pwsh.exe',  # PowerShell 7.x (x86)
-        ]
+        # 优先使用常驻PowerShell会话，省去每次启动PowerShell的开销
+        try:
+            return PowerShellSession.get().run(command, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return False, "PowerShell命令执行超时"
+        except SessionClosed:
+            return False, "程序正在退出"
+        except OSError:
+            pass  # 会话不可用时回退到单次启动方式
+        
+        # 尝试多种PowerShell路径，提高兼容性（不存在的路径已在首次调用时排除）
+        powershell_paths = available_powershell_paths()
         
         for ps_path in powershell_paths:
             try:
-                # 根据路径类型选择调用方式
-                if ps_path == 'powershell':
-                    # 使用shell=True调用系统PATH中的PowerShell
-                    result = subprocess.run(
-                        ['powershell', '-ExecutionPolicy', 'Bypass', '-Command', command], 
-                        capture_output=True, 
-                        text=True, 
-                        shell=True, 
-                        timeout=timeout,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                else:
-                    # 使用完整路径，不需要shell=True
-                    import os
-                    if not os.path.exists(ps_path):
-                        continue
-                    result = subprocess.run(
-                        [ps_path, '-ExecutionPolicy', 'Bypass', '-Command', command], 
-                        capture_output=True, 
-                        text=True, 
-                        timeout=timeout,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
+                # 直接启动PowerShell（不经过cmd.exe），参数按列表传递，无需额外转义；超时后结束整个进程树
+                result = run_powershell_once(ps_path, command, timeout=timeout)
                 
                 if result.returncode == 0:
                     return True, result.stdout.strip()
@@ -171,8 +359,11 @@ class NetworkAdapter:
                         continue
                     return False, result.stderr.strip() or "PowerShell命令执行失败"
                     
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                # 尝试下一个PowerShell路径
+            except subprocess.TimeoutExpired:
+                # 命令本身超时，换一个PowerShell再执行只会再等一次超时
+                return False, "PowerShell命令执行超时"
+            except (FileNotFoundError, OSError):
+                # 该路径无法启动，尝试下一个PowerShell路径
                 continue
             except Exception as e:
                 # 如果是最后一个路径，返回错误
@@ -182,19 +373,27 @@ class NetworkAdapter:
         
         return False, "未找到可用的PowerShell"
     
-    def get_all_adapters(self) -> List[Dict]:
-        """获取所有网络适配器信息（优化版）"""
-        adapters: List[Dict] = []
+    def get_all_adapters(self) -> List[AdapterInfo]:
+        """获取所有网络适配器信息（优化版）：优先PowerShell，失败时使用WMI"""
+        adapters: List[AdapterInfo] = []
         
         # 1) 首选 PowerShell：Get-NetAdapter（更稳定、无COM依赖）
         try:
-            ps_cmd = 'Get-NetAdapter -Physical | Select-Object Name,InterfaceDescription,MacAddress,Status,LinkSpeed | ConvertTo-Json -Depth 2'
+            # 一条管道同时取回双工（以及进程内API不可用时的IP），不再为每个适配器单独调用PowerShell
+            ips, ps_ip = _ip_lookup()
+            ps_cmd = (
+                "$ip = @{}; "
+                f"{ps_ip}"
+                "Get-NetAdapter -Physical | ForEach-Object { [PSCustomObject]@{ "
+                "Name = $_.Name; InterfaceDescription = $_.InterfaceDescription; MacAddress = $_.MacAddress; "
+                "Status = [string]$_.Status; LinkSpeed = $_.LinkSpeed; FullDuplex = $_.FullDuplex; "
+                "IPAddress = $ip[$_.Name] } } | "
+                "ConvertTo-Json -Depth 2 -Compress"
+            )
             success, output = self._run_powershell_safe(ps_cmd, timeout=6)
             if success and output:
                 try:
-                    data = json.loads(output)
-                    items = data if isinstance(data, list) else [data]
-                    for item in items:
+                    for item in _parse_json_items(output):
                         name = (item.get('InterfaceDescription') or item.get('Name') or '').strip()
                         alias = (item.get('Name') or '').strip()
                         mac = (item.get('MacAddress') or '').strip()
@@ -204,23 +403,22 @@ class NetworkAdapter:
                         # 跳过无效项（仍排除虚拟/回环，保留无线）
                         if not alias or not name or not mac:
                             continue
-                        if 'Virtual' in name or 'Loopback' in name:
+                        if _is_excluded_name(name):
                             continue
                         
-                        # 并行获取 IP/双工（基于 alias 作为 InterfaceAlias）
-                        adapters.append({
-                            'name': name,
-                            'device_id': alias,  # 无WMI DeviceID，这里用alias占位
-                            'mac_address': mac,
-                            'alias': alias,
-                            'ip_address': self._get_adapter_ip_fast(alias),
-                            'status': status,
-                            'speed': speed if speed else self._get_adapter_speed_fast(alias),
-                            'duplex': self._get_adapter_duplex_fast(alias)
-                        })
+                        adapters.append(AdapterInfo(
+                            name=name,
+                            device_id=alias,  # 无WMI DeviceID，这里用alias占位
+                            mac_address=mac,
+                            alias=alias,
+                            ip_address=ips.get(alias) or (item.get('IPAddress') or 'Unknown').strip(),
+                            status=status,
+                            speed=speed,
+                            duplex=_duplex_text(item.get('FullDuplex'))
+                        ))
                     
                     if adapters:
-                        logging.info(f"适配器枚举使用: PowerShell(Get-NetAdapter)，找到 {len(adapters)} 个")
+                        logging.info("适配器枚举使用: PowerShell(Get-NetAdapter)，找到 %d 个", len(adapters))
                         return adapters
                 except Exception:
                     # JSON解析失败则尝试WMI兜底
@@ -229,65 +427,179 @@ class NetworkAdapter:
             # PowerShell 失败，进入WMI兜底
             pass
         
-        # 2) 兜底：WMI（为避免跨线程复用同一连接，这里使用本地连接）
+        # 2) 兜底：WMI（连接和查询都在线程池中完成，带超时，避免枚举器无限期阻塞）
+        executor = _get_executor()
         try:
-            local_wmi = self._create_wmi_connection()
+            wmi_adapters = executor.submit(self._query_wmi_adapters).result(timeout=CONFIG['WMI_TIMEOUT'])
+        except FutureTimeoutError:
+            raise WMITimeout(f"WMI查询超时（{CONFIG['WMI_TIMEOUT']}秒）")
         except Exception as e:
-            raise Exception(f"WMI连接失败，已重试{CONFIG['MAX_RETRIES']}次: {str(e)}")
+            raise WMIConnectionError(f"WMI连接失败: {str(e)}") from e
         
         try:
-            wmi_adapters = []
-            for adapter in local_wmi.Win32_NetworkAdapter():
-                if (adapter.PhysicalAdapter and 
-                    adapter.Name and 
-                    adapter.MACAddress and
-                    'Virtual' not in adapter.Name and
-                    'Loopback' not in adapter.Name):
-                    wmi_adapters.append(adapter)
-            
-            with ThreadPoolExecutor(max_workers=CONFIG['THREAD_POOL_SIZE']) as executor:
-                futures = []
-                for adapter in wmi_adapters:
-                    future = executor.submit(self._get_adapter_details, adapter)
-                    futures.append(future)
-                for future in futures:
-                    try:
-                        adapter_info = future.result(timeout=10)
-                        if adapter_info:
-                            adapters.append(adapter_info)
-                    except Exception as e:
-                        print(f"获取适配器信息失败: {e}")
-                        continue
-            logging.info(f"适配器枚举使用: WMI 兜底，找到 {len(adapters)} 个")
+            link_info = self._fetch_link_info()
+            futures = [executor.submit(self._get_adapter_details, adapter, link_info) for adapter in wmi_adapters]
+            for future in futures:
+                try:
+                    adapter_info = future.result(timeout=10)
+                    if adapter_info:
+                        adapters.append(adapter_info)
+                except Exception as e:
+                    print(f"获取适配器信息失败: {e}")
+                    continue
+            logging.info("适配器枚举使用: WMI 兜底，找到 %d 个", len(adapters))
         except Exception as e:
             raise Exception(f"获取网络适配器失败: {str(e)}")
         
         return adapters
     
-    def _get_adapter_details(self, adapter) -> Optional[Dict]:
-        """获取单个适配器的详细信息"""
-        # 确保在线程池中也初始化COM组件
+    def get_all_adapters_with_status(self) -> List[AdapterInfo]:
+        """一次PowerShell调用获取所有适配器及其IP、双工、当前速度双工设置和支持的选项
+        
+        与 get_all_adapters 不同，返回的适配器会填好 actual_speed_duplex 和 speed_duplex_options；
+        批量查询失败时回退到 get_all_adapters（此时这两个字段为None）。
+        """
+        adapters = self._query_adapters_with_status()
+        if adapters:
+            logging.info("适配器枚举使用: PowerShell批量查询，找到 %d 个", len(adapters))
+            return adapters
+        return self.get_all_adapters()
+    
+    def get_single_adapter(self, alias: str) -> Optional[AdapterInfo]:
+        """只查询指定连接名称(alias)的适配器，字段与 get_all_adapters_with_status 相同"""
+        if not alias:
+            return None
+        adapters = self._query_adapters_with_status(alias)
+        return adapters[0] if adapters else None
+    
+    def _query_adapters_with_status(self, alias: str = None) -> Optional[List[AdapterInfo]]:
+        """执行批量状态查询，alias 不为空时只查询该适配器；失败返回None"""
+        if alias:
+            quoted = ps_quote(alias)
+            ip_filter = f' -InterfaceAlias {quoted}'
+            name_filter = f' -Name {quoted}'
+        else:
+            ip_filter = name_filter = ''
+        ips, ps_ip = _ip_lookup(ip_filter)
+        ps_cmd = (
+            "$ip = @{}; "
+            f"{ps_ip}"
+            "$sd = @{}; "
+            f"Get-NetAdapterAdvancedProperty{name_filter} -RegistryKeyword '*SpeedDuplex' -ErrorAction SilentlyContinue | "
+            "ForEach-Object { $sd[$_.Name] = $_ }; "
+            f"Get-NetAdapter{name_filter} -Physical | ForEach-Object {{ [PSCustomObject]@{{ "
+            "Name = $_.Name; InterfaceDescription = $_.InterfaceDescription; MacAddress = $_.MacAddress; "
+            "Status = [string]$_.Status; LinkSpeed = $_.LinkSpeed; FullDuplex = $_.FullDuplex; "
+            "MediaType = $_.MediaType; IPAddress = $ip[$_.Name]; SpeedDuplex = $sd[$_.Name].DisplayValue; "
+            "SpeedDuplexOptions = @($sd[$_.Name].ValidDisplayValues) } } | "
+            "ConvertTo-Json -Depth 2 -Compress"
+        )
         try:
-            pythoncom.CoInitialize()
-        except:
-            pass  # 如果已经初始化过，忽略错误
+            success, output = self._run_powershell_safe(ps_cmd, timeout=8)
+            if not (success and output):
+                return None
+            adapters = []
+            for item in _parse_json_items(output):
+                name = (item.get('InterfaceDescription') or item.get('Name') or '').strip()
+                item_alias = (item.get('Name') or '').strip()
+                mac = (item.get('MacAddress') or '').strip()
+                
+                # 与 get_all_adapters 相同的过滤规则
+                if not item_alias or not name or not mac:
+                    continue
+                if _is_excluded_name(name):
+                    continue
+                
+                options = [str(v).strip() for v in (item.get('SpeedDuplexOptions') or []) if v]
+                
+                adapters.append(AdapterInfo(
+                    name=name,
+                    device_id=item_alias,
+                    mac_address=mac,
+                    alias=item_alias,
+                    ip_address=ips.get(item_alias) or (item.get('IPAddress') or 'Unknown').strip(),
+                    status=item.get('Status'),
+                    speed=(item.get('LinkSpeed') or 'Unknown').strip(),
+                    duplex=_duplex_text(item.get('FullDuplex')),
+                    media_type=item.get('MediaType'),
+                    actual_speed_duplex=(item.get('SpeedDuplex') or 'Unknown').strip(),
+                    speed_duplex_options=options or None
+                ))
+            return adapters
+        except Exception as e:
+            logging.debug("批量查询适配器状态失败: %s", e)
+            return None
+    
+    def _query_wmi_adapters(self) -> List[AdapterInfo]:
+        """用本地WMI连接查询物理适配器（在线程池中执行）
         
+        只查询用到的字段；结果转换为 AdapterInfo 后返回，COM对象不离开创建它的线程。
+        IP、速度和双工由 _get_adapter_details 补充。
+        """
+        local_wmi = self._create_wmi_connection()
+        rows = local_wmi.query(
+            "SELECT Name, MACAddress, DeviceID, NetConnectionID, NetConnectionStatus "
+            "FROM Win32_NetworkAdapter WHERE PhysicalAdapter = TRUE AND MACAddress IS NOT NULL "
+            "AND NOT Name LIKE '%Virtual%' AND NOT Name LIKE '%Loopback%'"
+        )
+        adapters = []
+        for row in rows:
+            # 每次读取属性都是一次COM调用，每个字段只读一次
+            name, mac = row.Name, row.MACAddress
+            # 过滤条件已在WQL中执行，这里只作保险
+            if not name or not mac or _is_excluded_name(name):
+                continue
+            adapters.append(AdapterInfo(
+                name=name,
+                device_id=row.DeviceID,
+                mac_address=mac,
+                alias=row.NetConnectionID or name,
+                status=row.NetConnectionStatus
+            ))
+        return adapters
+    
+    def _fetch_link_info(self) -> Dict[str, dict]:
+        """一次查询所有适配器的IPv4地址、速度和双工，返回 {连接名称: {'ip', 'speed', 'duplex'}}"""
+        ips, ps_ip = _ip_lookup()
+        cmd = (
+            "$ip = @{}; "
+            f"{ps_ip}"
+            "Get-NetAdapter -ErrorAction SilentlyContinue | ForEach-Object { [PSCustomObject]@{ "
+            "Name = $_.Name; LinkSpeed = $_.LinkSpeed; FullDuplex = $_.FullDuplex; IPAddress = $ip[$_.Name] } } | "
+            "ConvertTo-Json -Depth 2 -Compress"
+        )
+        link_info = {}
         try:
-            connection_id = adapter.NetConnectionID or adapter.Name
-            
-            adapter_info = {
-                'name': adapter.Name,
-                'device_id': adapter.DeviceID,
-                'mac_address': adapter.MACAddress,
-                'alias': connection_id,
-                'ip_address': self._get_adapter_ip_fast(connection_id),
-                'status': adapter.NetConnectionStatus,
-                'speed': self._get_adapter_speed_fast(connection_id),
-                'duplex': self._get_adapter_duplex_fast(connection_id)
-            }
-            return adapter_info
+            success, output = self._run_powershell_safe(cmd, timeout=6)
+            if success and output:
+                for item in _parse_json_items(output):
+                    alias = item.get('Name')
+                    if alias:
+                        link_info[alias] = {
+                            'ip': ips.get(alias) or (item.get('IPAddress') or 'Unknown').strip(),
+                            'speed': (item.get('LinkSpeed') or 'Unknown').strip(),
+                            'duplex': _duplex_text(item.get('FullDuplex')),
+                        }
         except Exception as e:
-            print(f"获取适配器 {adapter.Name} 详细信息失败: {e}")
+            logging.debug("批量获取适配器链路信息失败: %s", e)
+        return link_info
+    
+    def _get_adapter_details(self, adapter: AdapterInfo, link_info: Dict[str, dict] = None) -> Optional[AdapterInfo]:
+        """补充单个适配器的IP、速度和双工信息；link_info 中已有该适配器时不再单独查询"""
+        try:
+            connection_id = adapter.alias
+            info = link_info.get(connection_id) if link_info else None
+            if info is not None:
+                adapter.ip_address = info['ip']
+                adapter.speed = info['speed']
+                adapter.duplex = info['duplex']
+                return adapter
+            adapter.ip_address = self._get_adapter_ip_fast(connection_id)
+            adapter.speed = self._get_adapter_speed_fast(connection_id)
+            adapter.duplex = self._get_adapter_duplex_fast(connection_id)
+            return adapter
+        except Exception as e:
+            print(f"获取适配器 {adapter.name} 详细信息失败: {e}")
             return None
     
     def _get_adapter_ip_fast(self, connection_id: str) -> str:
@@ -295,9 +607,13 @@ class NetworkAdapter:
         if not connection_id:
             return 'Unknown'
         
+        ips = _ipv4_by_alias()
+        if ips is not None:
+            return ips.get(connection_id, 'Unknown')
+        
         try:
             # 使用更简单的命令
-            cmd = f'(Get-NetIPAddress -InterfaceAlias "{connection_id}" -AddressFamily IPv4 -ErrorAction SilentlyContinue | Select-Object -First 1).IPAddress'
+            cmd = f'(Get-NetIPAddress -InterfaceAlias {ps_quote(connection_id)} -AddressFamily IPv4 -ErrorAction SilentlyContinue | Select-Object -First 1).IPAddress'
             success, result = self._run_powershell_safe(cmd, timeout=5)
             
             if success and result and result != 'Unknown':
@@ -313,7 +629,7 @@ class NetworkAdapter:
         
         try:
             # 简化命令，只尝试一种方法
-            cmd = f'(Get-NetAdapter -Name "{connection_id}" -ErrorAction SilentlyContinue).LinkSpeed'
+            cmd = f'(Get-NetAdapter -Name {ps_quote(connection_id)} -ErrorAction SilentlyContinue).LinkSpeed'
             success, result = self._run_powershell_safe(cmd, timeout=5)
             
             # 某些系统返回如"1 Gbps"或"100 Mbps"等字符串，直接返回更直观
@@ -330,23 +646,22 @@ class NetworkAdapter:
         
         try:
             # 简化命令
-            cmd = f'(Get-NetAdapter -Name "{connection_id}" -ErrorAction SilentlyContinue).FullDuplex'
+            cmd = f'(Get-NetAdapter -Name {ps_quote(connection_id)} -ErrorAction SilentlyContinue).FullDuplex'
             success, result = self._run_powershell_safe(cmd, timeout=5)
             
             if success and result:
-                if result.lower() == 'true':
-                    return "全双工"
-                elif result.lower() == 'false':
-                    return "半双工"
+                return _duplex_text(result.strip())
         except:
             pass
         return 'Unknown'
     
-    def get_adapter_by_name(self, name: str) -> Optional[Dict]:
-        """根据名称获取特定适配器信息"""
-        adapters = self.get_all_adapters()
+    def get_adapter_by_name(self, name: str, adapters: Optional[List[AdapterInfo]] = None) -> Optional[AdapterInfo]:
+        """根据名称获取特定适配器信息，调用方已有适配器列表时可通过 adapters 传入，避免重新枚举"""
+        if adapters is None:
+            adapters = self.get_all_adapters()
+        name = name.lower()
         for adapter in adapters:
-            if name.lower() in adapter['name'].lower():
+            if name in adapter.name.lower():
                 return adapter
         return None
     
@@ -354,15 +669,12 @@ class NetworkAdapter:
         """动态获取适配器支持的速度双工选项（优化版）"""
         if adapter_name:
             try:
-                # 转义适配器名称中的特殊字符
-                safe_name = adapter_name.replace('"', '`"').replace("'", "`'")
-                
                 # 简化命令，减少超时时间
-                cmd = f'Get-NetAdapterAdvancedProperty -Name "{safe_name}" -RegistryKeyword "*SpeedDuplex" -ErrorAction SilentlyContinue | Select-Object -ExpandProperty ValidDisplayValues'
+                cmd = f'@(Get-NetAdapterAdvancedProperty -Name {ps_quote(adapter_name)} -RegistryKeyword "*SpeedDuplex" -ErrorAction SilentlyContinue | Select-Object -ExpandProperty ValidDisplayValues) | ConvertTo-Json -Compress'
                 success, result = self._run_powershell_safe(cmd, timeout=6)
                 
                 if success and result:
-                    options = [line.strip() for line in result.split('\n') if line.strip()]
+                    options = [str(v).strip() for v in _parse_json_items(result) if v and str(v).strip()]
                     if options:
                         return options
                         
@@ -383,6 +695,9 @@ class NetworkAdapter:
             'admin_rights': False
         }
         
+        # PowerShell检查（同时启动常驻会话）放到线程池中，与WMI首次连接并行进行
+        ps_future = _get_executor().submit(self._run_powershell_safe, 'echo "test"', 3)
+        
         # 检查WMI
         try:
             results['wmi_available'] = self._init_wmi_connection()
@@ -391,14 +706,13 @@ class NetworkAdapter:
         
         # 检查PowerShell
         try:
-            success, _ = self._run_powershell_safe('echo "test"', timeout=3)
+            success, _ = ps_future.result()
             results['powershell_available'] = success
         except:
             pass
         
         # 检查管理员权限
         try:
-            import ctypes
             results['admin_rights'] = ctypes.windll.shell32.IsUserAnAdmin()
         except:
             pass
@@ -3,77 +3,86 @@
 用于修改Windows系统中网络适配器的速度和双工模式
 """
 
+import os
+import functools
 import subprocess
 import ctypes
 import sys
 from typing import Optional, Tuple, List
 
+from powershell_session import (PowerShellSession, SessionClosed, available_powershell_paths, ps_quote,
+                                run_powershell_once)
 
-class NetworkSettings:
-    def __init__(self):
-        self.is_admin = self._check_admin_rights()
-    
-    def _check_admin_rights(self) -> bool:
-        """检查当前是否有管理员权限，支持多种检测方法"""
+
+def _find_speed_duplex_property(quoted_name: str) -> str:
+    """把速度双工高级属性查找到 $__sd 的PowerShell语句：优先按 RegistryKeyword 匹配，没有时再按 DisplayName 匹配，
+    两种方式在同一次调用中完成
+    """
+    return (
+        f"$__sd = Get-NetAdapterAdvancedProperty -Name {quoted_name} -RegistryKeyword '*SpeedDuplex' -ErrorAction SilentlyContinue; "
+        f"if (-not $__sd) {{ $__sd = Get-NetAdapterAdvancedProperty -Name {quoted_name} -DisplayName '*Speed*Duplex*' -ErrorAction SilentlyContinue }}; "
+        "$__sd = $__sd | Select-Object -First 1; "
+    )
+
+
+def _speed_duplex_property(quoted_name: str) -> str:
+    """获取速度双工高级属性的PowerShell命令"""
+    return _find_speed_duplex_property(quoted_name) + "$__sd"
+
+
+@functools.lru_cache(maxsize=None)
+def _is_admin() -> bool:
+    """检查当前是否有管理员权限，支持多种检测方法
+
+    进程的权限在运行期间不会改变，结果只检查一次，所有 NetworkSettings 实例共用。
+    """
+    try:
+        # 方法1：使用ctypes检查
+        return ctypes.windll.shell32.IsUserAnAdmin()
+    except:
         try:
-            # 方法1：使用ctypes检查
-            return ctypes.windll.shell32.IsUserAnAdmin()
+            # 方法2：尝试访问需要管理员权限的注册表项
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
+                                 "SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System",
+                                 0, winreg.KEY_READ)
+            winreg.CloseKey(key)
+            return True
         except:
             try:
-                # 方法2：尝试访问需要管理员权限的注册表项
-                import winreg
-                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   "SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Policies\\System",
-                                   0, winreg.KEY_READ)
-                winreg.CloseKey(key)
+                # 方法3：尝试创建临时文件到系统目录
+                temp_file = os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'temp_admin_test.tmp')
+                with open(temp_file, 'w') as f:
+                    f.write('test')
+                os.remove(temp_file)
                 return True
             except:
-                try:
-                    # 方法3：尝试创建临时文件到系统目录
-                    import tempfile
-                    temp_file = os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), 'temp_admin_test.tmp')
-                    with open(temp_file, 'w') as f:
-                        f.write('test')
-                    os.remove(temp_file)
-                    return True
-                except:
-                    return False
+                return False
+
+
+class NetworkSettings:
+    def __init__(self):
+        self.is_admin = _is_admin()
     
     def _run_powershell_command(self, command: str) -> Tuple[bool, str]:
         """执行PowerShell命令并返回结果，支持多种Windows版本"""
-        # 尝试多种PowerShell路径，提高兼容性
-        powershell_paths = [
-            'powershell',  # 系统PATH中的PowerShell
-            r'C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe',  # Windows PowerShell 5.x
-            r'C:\Program Files\PowerShell\7\pwsh.exe',  # PowerShell 7.x
-            r'C:\Program Files (x86)\PowerShell\7\pwsh.exe',  # PowerShell 7.x (x86)
-        ]
+        # 优先使用常驻PowerShell会话，省去每次启动PowerShell的开销
+        try:
+            return PowerShellSession.get().run(command, timeout=10)
+        except subprocess.TimeoutExpired:
+            return False, "PowerShell命令执行超时"
+        except SessionClosed:
+            return False, "程序正在退出"
+        except OSError:
+            pass  # 会话不可用时回退到单次启动方式
+        
+        # 尝试多种PowerShell路径，提高兼容性（不存在的路径已在首次调用时排除）
+        powershell_paths = available_powershell_paths()
         
         for ps_path in powershell_paths:
             try:
-                # 根据路径类型选择调用方式
-                if ps_path == 'powershell':
-                    # 使用shell=True调用系统PATH中的PowerShell
-                    result = subprocess.run(
-                        ['powershell', '-ExecutionPolicy', 'Bypass', '-Command', command], 
-                        capture_output=True, 
-                        text=True, 
-                        shell=True, 
-                        timeout=10,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
-                else:
-                    # 使用完整路径，不需要shell=True
-                    import os
-                    if not os.path.exists(ps_path):
-                        continue
-                    result = subprocess.run(
-                        [ps_path, '-ExecutionPolicy', 'Bypass', '-Command', command], 
-                        capture_output=True, 
-                        text=True, 
-                        timeout=10,
-                        creationflags=subprocess.CREATE_NO_WINDOW
-                    )
+                # 直接启动PowerShell（不经过cmd.exe），参数按列表传递，无需额外转义；超时后结束整个进程树
+                result = run_powershell_once(ps_path, command, timeout=10)
                 
                 if result.returncode == 0:
                     return True, result.stdout.strip()
@@ -84,8 +93,11 @@ class NetworkSettings:
                     error_msg = result.stderr.strip() or result.stdout.strip() or "PowerShell命令执行失败"
                     return False, error_msg
                     
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                # 尝试下一个PowerShell路径
+            except subprocess.TimeoutExpired:
+                # 命令本身超时，换一个PowerShell再执行只会再等一次超时
+                return False, "PowerShell命令执行超时"
+            except (FileNotFoundError, OSError):
+                # 该路径无法启动，尝试下一个PowerShell路径
                 continue
             except Exception as e:
                 # 如果是最后一个路径，返回错误
@@ -108,30 +120,28 @@ class NetworkSettings:
             return False, "速度双工设置不能为空"
         
         try:
-            # 转义特殊字符
-            safe_adapter_name = adapter_name.replace('"', '`"').replace("'", "`'")
-            safe_speed_duplex = speed_duplex.replace('"', '`"').replace("'", "`'")
+            # 以单引号字面量传入，名称中的 $、反引号、引号都不会被PowerShell解释
+            safe_adapter_name = ps_quote(adapter_name)
+            safe_speed_duplex = ps_quote(speed_duplex)
             
-            # 先尝试使用 RegistryKeyword，再回退到 DisplayName 匹配
-            commands = [
-                f'Set-NetAdapterAdvancedProperty -Name "{safe_adapter_name}" -RegistryKeyword "*SpeedDuplex" -DisplayValue "{safe_speed_duplex}"',
-                f'Set-NetAdapterAdvancedProperty -Name "{safe_adapter_name}" -DisplayName "*Speed*Duplex*" -DisplayValue "{safe_speed_duplex}"'
-            ]
-            last_err = ''
-            for command in commands:
-                success, message = self._run_powershell_command(command)
-                if success:
-                    return True, f"成功设置 {adapter_name} 的网络设置为 {speed_duplex}"
-                last_err = message
-            # 两种方式都失败，返回更清晰的错误并提示可用值
-            tips_cmd = (
-                f'Get-NetAdapterAdvancedProperty -Name "{safe_adapter_name}" | '
-                f'Where-Object {{$_.RegistryKeyword -like "*Speed*" -or $_.DisplayName -like "*Duplex*" -or $_.DisplayName -like "*Speed*"}} | '
-                'Select-Object -Property DisplayName, RegistryKeyword, DisplayValue | Format-Table -AutoSize'
+            # 查找属性（RegistryKeyword 优先，回退到 DisplayName）、设置、失败时收集可用值，都在一次调用中完成
+            command = (
+                f"{_find_speed_duplex_property(safe_adapter_name)}"
+                "try { "
+                "if (-not $__sd) { throw '未找到速度双工高级属性' }; "
+                f"$__sd | Set-NetAdapterAdvancedProperty -DisplayValue {safe_speed_duplex} -ErrorAction Stop "
+                "} catch { "
+                "$__err = $_.Exception.Message; "
+                f"$__tips = Get-NetAdapterAdvancedProperty -Name {safe_adapter_name} -ErrorAction SilentlyContinue | "
+                "Where-Object { $_.RegistryKeyword -like '*Speed*' -or $_.DisplayName -like '*Duplex*' -or $_.DisplayName -like '*Speed*' } | "
+                "Select-Object -Property DisplayName, RegistryKeyword, DisplayValue | Format-Table -AutoSize | Out-String; "
+                "if ($__tips.Trim()) { $__err += \"`n`n可用的相关高级属性如下(供排查):`n$($__tips.Trim())\" }; "
+                "throw $__err }"
             )
-            _ok, tips = self._run_powershell_command(tips_cmd)
-            hint = f"\n\n可用的相关高级属性如下(供排查):\n{tips}" if tips else ''
-            return False, f"设置失败: {last_err}{hint}"
+            success, message = self._run_powershell_command(command)
+            if success:
+                return True, f"成功设置 {adapter_name} 的网络设置为 {speed_duplex}"
+            return False, f"设置失败: {message}"
                 
         except Exception as e:
             return False, f"设置失败: {str(e)}"
@@ -142,35 +152,21 @@ class NetworkSettings:
         注意：此方法已弃用，建议直接使用 NetworkAdapter.get_speed_duplex_options()
         为了避免循环导入，这里使用延迟导入
         """
+        # 延迟导入避免循环依赖
+        from network_adapter import DEFAULT_SPEED_DUPLEX_OPTIONS
+        
         try:
-            # 延迟导入避免循环依赖
-            from network_adapter import DEFAULT_SPEED_DUPLEX_OPTIONS
-            
-            # 转义适配器名称中的特殊字符
-            safe_name = adapter_name.replace('"', '`"').replace("'", "`'")
-            
-            # 尝试多种方法获取选项
-            commands = [
-                f'Get-NetAdapterAdvancedProperty -Name "{safe_name}" -RegistryKeyword "*SpeedDuplex" | Select-Object -ExpandProperty ValidDisplayValues',
-                f'Get-NetAdapterAdvancedProperty -Name "{safe_name}" -DisplayName "*Speed*Duplex*" | Select-Object -ExpandProperty ValidDisplayValues'
-            ]
-            
-            for command in commands:
-                success, result = self._run_powershell_command(command)
-                if success and result.strip():
-                    options = [line.strip() for line in result.strip().split('\n') if line.strip()]
-                    if options:
-                        return options
+            command = f'{_speed_duplex_property(ps_quote(adapter_name))} | Select-Object -ExpandProperty ValidDisplayValues'
+            success, result = self._run_powershell_command(command)
+            if success and result.strip():
+                options = [line.strip() for line in result.strip().split('\n') if line.strip()]
+                if options:
+                    return options
         except Exception:
             pass
         
         # 使用统一的默认选项
-        try:
-            from network_adapter import DEFAULT_SPEED_DUPLEX_OPTIONS
-            return DEFAULT_SPEED_DUPLEX_OPTIONS.copy()
-        except ImportError:
-            # 如果导入失败，使用本地默认值
-            return ["自动侦测", "10 Mbps 半双工", "10 Mbps 全双工", "100 Mbps 半双工", "100 Mbps 全双工", "1.0 Gbps 全双工"]
+        return DEFAULT_SPEED_DUPLEX_OPTIONS.copy()
     
     def get_current_speed_duplex(self, adapter_name: str) -> str:
         """获取当前的速度双工设置"""
@@ -178,18 +174,11 @@ class NetworkSettings:
             return "Unknown"
             
         try:
-            # 转义特殊字符
-            safe_adapter_name = adapter_name.replace('"', '`"').replace("'", "`'")
-            
             # 使用 Get-NetAdapterAdvancedProperty 获取当前设置
-            commands = [
-                f'Get-NetAdapterAdvancedProperty -Name "{safe_adapter_name}" -RegistryKeyword "*SpeedDuplex" | Select-Object -ExpandProperty DisplayValue',
-                f'Get-NetAdapterAdvancedProperty -Name "{safe_adapter_name}" -DisplayName "*Speed*Duplex*" | Select-Object -ExpandProperty DisplayValue'
-            ]
-            for command in commands:
-                success, result = self._run_powershell_command(command)
-                if success and result.strip():
-                    return result.strip()
+            command = f'{_speed_duplex_property(ps_quote(adapter_name))} | Select-Object -ExpandProperty DisplayValue'
+            success, result = self._run_powershell_command(command)
+            if success and result.strip():
+                return result.strip()
         except (subprocess.TimeoutExpired, subprocess.SubprocessError):
             pass
         return "Unknown"
@@ -199,21 +188,20 @@ class NetworkSettings:
         if not self.is_admin:
             return False, "需要管理员权限才能重启网络适配器"
         
-        # 禁用适配器
-        disable_cmd = f'Disable-NetAdapter -Name "{adapter_name}" -Confirm:$false'
-        success, message = self._run_powershell_command(disable_cmd)
-        
-        if not success:
-            return False, f"禁用适配器失败: {message}"
-        
-        # 启用适配器
-        enable_cmd = f'Enable-NetAdapter -Name "{adapter_name}" -Confirm:$false'
-        success, message = self._run_powershell_command(enable_cmd)
+        # 禁用和启用在同一次调用中依次执行，失败时由抛出的消息区分是哪一步
+        safe_name = ps_quote(adapter_name)
+        command = (
+            f"try {{ Disable-NetAdapter -Name {safe_name} -Confirm:$false -ErrorAction Stop }} "
+            "catch { throw \"禁用适配器失败: $($_.Exception.Message)\" }; "
+            f"try {{ Enable-NetAdapter -Name {safe_name} -Confirm:$false -ErrorAction Stop }} "
+            "catch { throw \"启用适配器失败: $($_.Exception.Message)\" }"
+        )
+        success, message = self._run_powershell_command(command)
         
         if success:
             return True, f"成功重启适配器 {adapter_name}"
         else:
-            return False, f"启用适配器失败: {message}"
+            return False, message
     
     def request_admin_rights(self):
         """请求管理员权限重新启动程序"""
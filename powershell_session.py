@@ -0,0 +1,275 @@
+"""
+常驻PowerShell会话模块
+通过标准输入向同一个PowerShell进程发送命令，避免每次调用都重新启动PowerShell
+"""
+
+import os
+import base64
+import functools
+import queue
+import shutil
+import atexit
+import logging
+import threading
+import subprocess
+import time
+import uuid
+from typing import Optional, Tuple
+
+# 按优先级尝试的PowerShell路径
+POWERSHELL_PATHS = [
+    'powershell',  # 系统PATH中的PowerShell
+    r'C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe',  # Windows PowerShell 5.x
+    r'C:\Program Files\PowerShell\7\pwsh.exe',  # PowerShell 7.x
+    r'C:\Program Files (x86)\PowerShell\7\pwsh.exe',  # PowerShell 7.x (x86)
+]
+
+# 所有PowerShell进程共用的启动参数：不显示版权信息、不加载用户配置文件、非交互模式
+POWERSHELL_ARGS = ('-NoLogo', '-NoProfile', '-NonInteractive', '-ExecutionPolicy', 'Bypass')
+
+
+@functools.lru_cache(maxsize=None)
+def powershell_env() -> dict:
+    """启动PowerShell时使用的环境变量：在当前环境基础上关闭遥测"""
+    return {**os.environ, 'POWERSHELL_TELEMETRY_OPTOUT': '1'}
+
+
+@functools.lru_cache(maxsize=None)
+def available_powershell_paths() -> Tuple[str, ...]:
+    """POWERSHELL_PATHS 中存在的路径（'powershell' 在系统PATH中能找到时保留），只检查一次"""
+    return tuple(p for p in POWERSHELL_PATHS
+                 if (shutil.which(p) if p == 'powershell' else os.path.exists(p)))
+
+
+def _kill_process_tree(proc):
+    """结束进程及其启动的所有子进程
+
+    PowerShell启动的子进程会继承输出管道，只结束PowerShell本身时，读取输出会一直等到这些子进程退出。
+    """
+    try:
+        subprocess.run(['taskkill', '/PID', str(proc.pid), '/T', '/F'],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5,
+                       creationflags=subprocess.CREATE_NO_WINDOW)
+    except Exception:
+        pass
+    try:
+        proc.kill()
+    except Exception:
+        pass
+
+
+def run_powershell_once(ps_path: str, command: str, timeout: float) -> subprocess.CompletedProcess:
+    """单次启动PowerShell执行命令（常驻会话不可用时使用），超时后结束整个进程树
+
+    Raises:
+        subprocess.TimeoutExpired: 命令超时
+        OSError: 该路径的PowerShell无法启动
+    """
+    with subprocess.Popen(
+        [ps_path, *POWERSHELL_ARGS, '-Command', command],
+        stdin=subprocess.DEVNULL,  # 不继承标准输入，避免PowerShell等待输入
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=powershell_env(),
+        creationflags=subprocess.CREATE_NO_WINDOW
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill_process_tree(proc)
+            try:
+                proc.communicate(timeout=2)  # 读完剩余输出，释放管道
+            except subprocess.TimeoutExpired:
+                pass
+            raise
+    return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+
+def ps_quote(value: str) -> str:
+    """把字符串转换为PowerShell单引号字面量：不展开 $ 和反引号，只需把单引号写两次"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+class SessionClosed(Exception):
+    """会话已被 terminate() 关闭，调用方不应再回退到单次启动PowerShell"""
+
+
+class PowerShellSession:
+    """常驻PowerShell进程，命令串行执行（线程安全），进程异常退出或超时后会自动重启"""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._proc = None
+        self._lines = None  # 读取线程放入的输出行
+        self._sentinel = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def get(cls) -> 'PowerShellSession':
+        """获取全局共享的会话实例"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    atexit.register(cls._instance.close)
+        return cls._instance
+
+    def _start(self) -> bool:
+        """启动PowerShell进程，成功返回True
+
+        Raises:
+            SessionClosed: 启动期间会话已被 terminate() 关闭
+        """
+        for ps_path in available_powershell_paths():
+            try:
+                proc = subprocess.Popen(
+                    [ps_path, *POWERSHELL_ARGS, '-Command', '-'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding='utf-8',
+                    errors='replace',
+                    bufsize=1,
+                    env=powershell_env(),
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                )
+            except (FileNotFoundError, OSError):
+                continue
+
+            # terminate() 不获取命令锁，可能在启动期间被调用（此时 _kill 看不到新进程），由这里结束它
+            if self._closed:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass
+                raise SessionClosed()
+
+            self._proc = proc
+            self._sentinel = f"__PS_SESSION_END_{uuid.uuid4().hex}__"
+            self._lines = queue.SimpleQueue()
+            threading.Thread(target=self._read_stdout, args=(proc, self._lines),
+                             daemon=True).start()
+            try:
+                # 统一使用UTF-8输出，关闭进度条输出，出错时抛出异常以便判断命令是否成功
+                self._write("[Console]::OutputEncoding = [Text.Encoding]::UTF8; "
+                            "$ProgressPreference = 'SilentlyContinue'; "
+                            "$ErrorActionPreference = 'Stop'")
+            except OSError:
+                self._kill()
+                continue
+            return True
+        return False
+
+    @staticmethod
+    def _read_stdout(proc, lines):
+        """后台读取PowerShell输出，进程结束时放入None"""
+        try:
+            for line in proc.stdout:
+                lines.put(line.rstrip('\r\n'))
+        except Exception:
+            pass
+        lines.put(None)
+
+    def _write(self, line: str):
+        self._proc.stdin.write(line + '\n')
+        self._proc.stdin.flush()
+
+    def _kill(self):
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+        except Exception:
+            pass
+
+    def run(self, command: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        """执行命令，返回 (是否成功, 输出或错误信息)
+
+        Raises:
+            subprocess.TimeoutExpired: 命令超时（会话会被重置）
+            OSError: PowerShell无法启动或进程意外退出
+            SessionClosed: 会话已被 terminate() 关闭
+        """
+        # 命令以Base64传入，避免引号转义问题，并保证整条命令在一行内
+        encoded = base64.b64encode(command.encode('utf-8')).decode('ascii')
+        script = (
+            "try { "
+            "$__cmd = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('" + encoded + "')); "
+            "$__out = Invoke-Expression $__cmd; "
+            # 单个字符串（如 ConvertTo-Json -Compress 的结果）原样输出，避免被 Out-String 按宽度折行
+            "if ($__out -is [string]) { $__out } else { $__out | Out-String -Stream -Width 4096 }; $__status = 'OK' "
+            "} catch { $_.Exception.Message; $__status = 'ERR' }; "
+            "Write-Output \"{sentinel} $__status\""
+        )
+
+        with self._lock:
+            if self._closed:
+                raise SessionClosed()
+            if self._proc is None or self._proc.poll() is not None:
+                if not self._start():
+                    raise OSError("未找到可用的PowerShell")
+                if self._closed:
+                    self._kill()
+                    raise SessionClosed()
+
+            sentinel = self._sentinel
+            try:
+                self._write(script.replace('{sentinel}', sentinel))
+            except OSError:
+                self._kill()
+                raise
+
+            # 超时针对整条命令，而不是两行输出之间的间隔
+            deadline = None if timeout is None else time.monotonic() + timeout
+            output = []
+            while True:
+                try:
+                    remaining = None if deadline is None else max(0, deadline - time.monotonic())
+                    line = self._lines.get(timeout=remaining)
+                except queue.Empty:
+                    # 超时后进程可能仍在执行命令，连同其子进程一起结束并重置会话
+                    _kill_process_tree(self._proc)
+                    self._kill()
+                    raise subprocess.TimeoutExpired(command, timeout)
+                if line is None:
+                    self._kill()
+                    if self._closed:
+                        raise SessionClosed()
+                    raise OSError("PowerShell进程意外退出")
+                if line.startswith(sentinel):
+                    ok = line[len(sentinel):].strip() == 'OK'
+                    break
+                output.append(line)
+
+        text = '\n'.join(output).strip()
+        if ok:
+            return True, text
+        return False, text or "PowerShell命令执行失败"
+
+    def close(self):
+        """结束PowerShell进程"""
+        with self._lock:
+            proc = self._proc
+            if proc is None:
+                return
+            try:
+                self._write('exit')
+                proc.wait(timeout=2)
+            except Exception:
+                pass
+            self._kill()
+            logging.debug("PowerShell会话已关闭")
+
+    def terminate(self):
+        """程序退出时立即结束PowerShell进程，不等待正在执行的命令
+
+        不获取命令锁：正在等待输出的 run() 会因进程退出而返回，之后的调用直接抛出 SessionClosed。
+        """
+        self._closed = True
+        self._kill()
@@ -3,12 +3,68 @@
 用于检查不同Windows版本和环境的兼容性
 """
 
-import os
 import sys
+import ctypes
+import functools
 import platform
+import shutil
 import subprocess
 import logging
 from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+from powershell_session import PowerShellSession, available_powershell_paths
+
+
+class _SERVICE_STATUS(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_ulong) for name in (
+        'dwServiceType', 'dwCurrentState', 'dwControlsAccepted', 'dwWin32ExitCode',
+        'dwServiceSpecificExitCode', 'dwCheckPoint', 'dwWaitHint')]
+
+
+_SC_MANAGER_CONNECT = 0x0001
+_SERVICE_QUERY_STATUS = 0x0004
+_SERVICE_RUNNING = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _advapi32():
+    """私有的 advapi32 句柄，函数原型只设置一次，不影响其他使用 windll.advapi32 的代码；非Windows返回None"""
+    try:
+        advapi32 = ctypes.WinDLL('advapi32')
+    except (AttributeError, OSError):
+        return None
+    advapi32.OpenSCManagerW.restype = ctypes.c_void_p
+    advapi32.OpenSCManagerW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_ulong]
+    advapi32.OpenServiceW.restype = ctypes.c_void_p
+    advapi32.OpenServiceW.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_ulong]
+    advapi32.QueryServiceStatus.argtypes = [ctypes.c_void_p, ctypes.POINTER(_SERVICE_STATUS)]
+    advapi32.CloseServiceHandle.argtypes = [ctypes.c_void_p]
+    return advapi32
+
+
+def _is_service_running(service_name: str):
+    """通过服务控制管理器API查询服务是否正在运行，省去启动 sc.exe；API不可用或调用失败时返回None"""
+    advapi32 = _advapi32()
+    if advapi32 is None:
+        return None
+    
+    scm = advapi32.OpenSCManagerW(None, None, _SC_MANAGER_CONNECT)
+    if not scm:
+        return None
+    try:
+        service = advapi32.OpenServiceW(scm, service_name, _SERVICE_QUERY_STATUS)
+        if not service:
+            return None
+        try:
+            status = _SERVICE_STATUS()
+            if not advapi32.QueryServiceStatus(service, ctypes.byref(status)):
+                return None
+            return status.dwCurrentState == _SERVICE_RUNNING
+        finally:
+            advapi32.CloseServiceHandle(service)
+    finally:
+        advapi32.CloseServiceHandle(scm)
 
 
 class SystemCompatibility:
@@ -32,13 +88,12 @@ class SystemCompatibility:
                 'is_admin': self._check_admin_simple()
             }
         except Exception as e:
-            logging.warning(f"获取系统信息失败: {e}")
+            logging.warning("获取系统信息失败: %s", e)
             return {}
     
     def _check_admin_simple(self) -> bool:
         """简单的管理员权限检查"""
         try:
-            import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin()
         except:
             return False
@@ -52,61 +107,31 @@ class SystemCompatibility:
             'execution_policy': 'Unknown'
         }
         
-        # 检查多种PowerShell路径
-        powershell_paths = [
-            'powershell',
-            r'C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe',
-            r'C:\Program Files\PowerShell\7\pwsh.exe',
-            r'C:\Program Files (x86)\PowerShell\7\pwsh.exe'
-        ]
-        
-        for ps_path in powershell_paths:
+        # 与运行时使用相同的PowerShell路径列表（不存在的路径已排除），报告与实际使用的路径一致
+        for ps_path in available_powershell_paths():
             try:
-                if ps_path != 'powershell' and not os.path.exists(ps_path):
-                    continue
-                    
-                # 测试PowerShell是否可用
-                cmd = [ps_path, '-Command', 'echo "test"'] if ps_path != 'powershell' else ['powershell', '-Command', 'echo "test"']
+                # 一次启动同时完成可用性测试、读取版本和执行策略（每行一项）
+                # 不加载用户配置文件；不指定 -ExecutionPolicy，以便读取系统实际的执行策略
+                cmd = [ps_path, '-NoLogo', '-NoProfile', '-NonInteractive', '-Command',
+                       '$PSVersionTable.PSVersion.ToString(); [string](Get-ExecutionPolicy)']
                 
-                if ps_path == 'powershell':
-                    proc = subprocess.run(cmd, capture_output=True, text=True, shell=True, timeout=5)
-                else:
-                    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+                proc = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=5,
+                                      creationflags=subprocess.CREATE_NO_WINDOW)
                 
                 if proc.returncode == 0:
                     result['available'] = True
                     result['path'] = ps_path
                     
-                    # 获取版本信息
-                    try:
-                        version_cmd = [ps_path, '-Command', '$PSVersionTable.PSVersion.ToString()'] if ps_path != 'powershell' else ['powershell', '-Command', '$PSVersionTable.PSVersion.ToString()']
-                        if ps_path == 'powershell':
-                            version_proc = subprocess.run(version_cmd, capture_output=True, text=True, shell=True, timeout=5)
-                        else:
-                            version_proc = subprocess.run(version_cmd, capture_output=True, text=True, timeout=5)
-                        
-                        if version_proc.returncode == 0:
-                            result['version'] = version_proc.stdout.strip()
-                    except:
-                        pass
-                    
-                    # 获取执行策略
-                    try:
-                        policy_cmd = [ps_path, '-Command', 'Get-ExecutionPolicy'] if ps_path != 'powershell' else ['powershell', '-Command', 'Get-ExecutionPolicy']
-                        if ps_path == 'powershell':
-                            policy_proc = subprocess.run(policy_cmd, capture_output=True, text=True, shell=True, timeout=5)
-                        else:
-                            policy_proc = subprocess.run(policy_cmd, capture_output=True, text=True, timeout=5)
-                        
-                        if policy_proc.returncode == 0:
-                            result['execution_policy'] = policy_proc.stdout.strip()
-                    except:
-                        pass
+                    lines = [line.strip() for line in proc.stdout.splitlines() if line.strip()]
+                    if len(lines) >= 1:
+                        result['version'] = lines[0]
+                    if len(lines) >= 2:
+                        result['execution_policy'] = lines[1]
                     
                     break
                     
             except Exception as e:
-                logging.debug(f"PowerShell路径 {ps_path} 检查失败: {e}")
+                logging.debug("PowerShell路径 %s 检查失败: %s", ps_path, e)
                 continue
         
         return result
@@ -120,18 +145,20 @@ class SystemCompatibility:
         }
         
         try:
-            # 检查WMI服务状态
-            wmi_service_cmd = ['sc', 'query', 'winmgmt']
-            proc = subprocess.run(wmi_service_cmd, capture_output=True, text=True, timeout=10)
-            
-            if proc.returncode == 0 and 'RUNNING' in proc.stdout:
-                result['service_running'] = True
+            # 检查WMI服务状态：优先直接查询服务控制管理器，失败时再调用 sc.exe
+            running = _is_service_running('winmgmt')
+            if running is None:
+                wmi_service_cmd = ['sc', 'query', 'winmgmt']
+                proc = subprocess.run(wmi_service_cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                                      timeout=10, creationflags=subprocess.CREATE_NO_WINDOW)
+                running = proc.returncode == 0 and 'RUNNING' in proc.stdout
+            result['service_running'] = running
             
             # 尝试导入wmi模块
             try:
                 import wmi
                 # 尝试创建WMI连接
-                wmi_conn = wmi.WMI()
+                wmi_conn = wmi.WMI(find_classes=False)
                 result['available'] = True
             except ImportError:
                 result['error'] = 'WMI模块未安装'
@@ -151,41 +178,37 @@ class SystemCompatibility:
             'wmic_available': False
         }
         
-        # 检查netsh
-        try:
-            proc = subprocess.run(['netsh', 'interface', 'show', 'interface'], 
-                                capture_output=True, text=True, timeout=10)
-            result['netsh_available'] = proc.returncode == 0
-        except:
-            pass
+        # 检查netsh：只需确认命令存在，不必启动它枚举接口
+        result['netsh_available'] = shutil.which('netsh') is not None
         
-        # 检查Get-NetAdapter (PowerShell)
+        # 检查Get-NetAdapter (PowerShell)，复用常驻PowerShell会话；只确认命令存在，不实际枚举适配器
         try:
-            proc = subprocess.run(['powershell', '-Command', 'Get-NetAdapter | Select-Object -First 1'], 
-                                capture_output=True, text=True, shell=True, timeout=10)
-            result['get_netadapter_available'] = proc.returncode == 0
+            success, output = PowerShellSession.get().run(
+                "[bool](Get-Command Get-NetAdapter -ErrorAction SilentlyContinue)", timeout=10)
+            result['get_netadapter_available'] = success and output.strip() == 'True'
         except:
             pass
         
-        # 检查wmic
-        try:
-            proc = subprocess.run(['wmic', 'path', 'win32_networkadapter', 'get', 'name', '/format:list'], 
-                                capture_output=True, text=True, timeout=10)
-            result['wmic_available'] = proc.returncode == 0
-        except:
-            pass
+        # 检查wmic：只需确认命令存在（新版Windows已移除wmic），不必启动它枚举一遍网卡
+        result['wmic_available'] = shutil.which('wmic') is not None
         
         return result
     
     def get_compatibility_report(self) -> Dict:
         """获取完整的兼容性报告"""
-        report = {
-            'system_info': self.system_info,
-            'powershell': self.check_powershell_compatibility(),
-            'wmi': self.check_wmi_compatibility(),
-            'network_commands': self.check_network_commands_compatibility(),
-            'recommendations': []
-        }
+        # 各项检查互不依赖且都在等待子进程，PowerShell和网络命令检查放到线程池中与WMI检查同时进行；
+        # WMI检查留在当前线程，使用本线程已初始化的COM
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ps_future = executor.submit(self.check_powershell_compatibility)
+            net_future = executor.submit(self.check_network_commands_compatibility)
+            wmi_result = self.check_wmi_compatibility()
+            report = {
+                'system_info': self.system_info,
+                'powershell': ps_future.result(),
+                'wmi': wmi_result,
+                'network_commands': net_future.result(),
+                'recommendations': []
+            }
         
         # 生成建议
         recommendations = []